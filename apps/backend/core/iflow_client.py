@@ -266,13 +266,11 @@ async def send_agent_message(client: Any, message: str) -> None:
     raise RuntimeError("Client does not support query/send_message")
 
 
-async def iter_agent_messages(client: Any) -> AsyncIterator[Any]:
+def iter_agent_messages(client: Any) -> AsyncIterator[Any]:
+    # Hand back the client's own iterator rather than re-yielding from a
+    # wrapper generator, which cost an extra resume per streamed message
     if hasattr(client, "receive_response"):
-        async for msg in client.receive_response():
-            yield msg
-        return
+        return client.receive_response()
     if hasattr(client, "receive_messages"):
-        async for msg in client.receive_messages():
-            yield msg
-        return
+        return client.receive_messages()
     raise RuntimeError("Client does not support receive_response/receive_messages")
@@ -0,0 +1,82 @@
+"""
+JSON File Helpers
+=================
+
+Fast JSON parsing and serialization for pipeline artifacts
+(project_index.json, scope_contract.json, phase reports).
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, so callers get the same results either way: pretty-printed,
+2-space-indented JSON written as UTF-8 bytes. Writes are atomic.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# orjson is optional: it parses/serializes several times faster than json
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
+
+# mkstemp() creates files as 0600; write_json() widens them to what
+# open() would have used. os.umask() can only be read by setting it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj as 2-space-indented UTF-8 JSON bytes."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file without a text-mode decode step."""
+    return loads(Path(path).read_bytes())
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """
+    Serialize obj and write it to path as indented JSON.
+
+    The bytes go to a temp file in the same directory which then replaces
+    path, so readers (the UI polls these files) never see a partial report.
+    """
+    path = Path(path)
+    data = dumps(obj)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), _FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
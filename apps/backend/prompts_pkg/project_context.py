@@ -11,10 +11,33 @@ saving context window and keeping agents focused.
 """
 
 import json
+import os
+import time
 from pathlib import Path
 
 from init import resolve_auto_build_dir
 
+# Dependency files whose changes can alter detected frameworks
+_DEPENDENCY_FILES = frozenset(
+    {
+        "package.json",
+        "pyproject.toml",
+        "requirements.txt",
+        "Gemfile",
+        "go.mod",
+        "Cargo.toml",
+        "composer.json",
+    }
+)
+# Checked inside first-level subdirectories for monorepos
+_SUBDIR_DEPENDENCY_FILES = ("package.json", "pyproject.toml")
+_SKIP_DIRS = frozenset({"node_modules", "__pycache__", "dist", "build"})
+
+# Recent refresh decisions keyed by (project_dir, index mtime_ns), stored with
+# a monotonic timestamp
+_REFRESH_CACHE_TTL_SECONDS = 30.0
+_REFRESH_CACHE: dict[tuple[Path, int], tuple[float, bool]] = {}
+
 
 def load_project_index(project_dir: Path) -> dict:
     """
@@ -172,6 +195,8 @@ def should_refresh_project_index(project_dir: Path) -> bool:
 
     Uses smart caching: only refresh if dependency files (package.json,
     pyproject.toml, etc.) have been modified since the last index generation.
+    Answers are memoized for _REFRESH_CACHE_TTL_SECONDS, keyed by the project
+    and the index mtime, so a regenerated index is always re-checked.
 
     Args:
         project_dir: Root directory of the project
@@ -181,63 +206,52 @@ def should_refresh_project_index(project_dir: Path) -> bool:
     """
     index_file = resolve_auto_build_dir(project_dir) / "project_index.json"
 
-    if not index_file.exists():
-        return True  # No index, must generate
-
     try:
-        index_mtime = index_file.stat().st_mtime
+        index_mtime_ns = index_file.stat().st_mtime_ns
     except OSError:
-        return True  # Can't stat file, regenerate
-
-    # Check all dependency files that could change frameworks
-    dep_files = [
-        project_dir / "package.json",
-        project_dir / "pyproject.toml",
-        project_dir / "requirements.txt",
-        project_dir / "Gemfile",
-        project_dir / "go.mod",
-        project_dir / "Cargo.toml",
-        project_dir / "composer.json",
-    ]
-
-    for dep_file in dep_files:
-        try:
-            dep_mtime = dep_file.stat().st_mtime
-            if dep_mtime > index_mtime:
-                return True  # Dependency file changed, refresh needed
-        except (OSError, FileNotFoundError):
-            continue  # Skip files we can't stat or don't exist
-
-    # Also check subdirectories for monorepos (first level only)
+        return True  # No index (or can't stat it), must generate
+
+    cache_key = (Path(project_dir), index_mtime_ns)
+    now = time.monotonic()
+    cached = _REFRESH_CACHE.get(cache_key)
+    if cached is not None and now - cached[0] < _REFRESH_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    result = _dependencies_newer_than(project_dir, index_mtime_ns)
+    for key in [
+        key
+        for key, (stored_at, _) in _REFRESH_CACHE.items()
+        if now - stored_at >= _REFRESH_CACHE_TTL_SECONDS
+    ]:
+        del _REFRESH_CACHE[key]
+    _REFRESH_CACHE[cache_key] = (now, result)
+    return result
+
+
+def _dependencies_newer_than(project_dir: Path, index_mtime_ns: int) -> bool:
+    """Whether any dependency file was modified after the index, in one scandir pass."""
     try:
-        for subdir in project_dir.iterdir():
-            if not subdir.is_dir():
-                continue
-            # Skip hidden dirs and common non-service dirs
-            if subdir.name.startswith(".") or subdir.name in (
-                "node_modules",
-                "__pycache__",
-                "dist",
-                "build",
-                ".git",
-            ):
-                continue
-
-            subdir_pkg = subdir / "package.json"
-            try:
-                pkg_mtime = subdir_pkg.stat().st_mtime
-                if pkg_mtime > index_mtime:
-                    return True
-            except (OSError, FileNotFoundError):
-                continue
-
-            subdir_pyproject = subdir / "pyproject.toml"
-            try:
-                pyproject_mtime = subdir_pyproject.stat().st_mtime
-                if pyproject_mtime > index_mtime:
-                    return True
-            except (OSError, FileNotFoundError):
-                continue
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        # Monorepo services (first level only)
+                        if entry.name.startswith(".") or entry.name in _SKIP_DIRS:
+                            continue
+                        for name in _SUBDIR_DEPENDENCY_FILES:
+                            try:
+                                dep_mtime_ns = os.stat(
+                                    os.path.join(entry.path, name)
+                                ).st_mtime_ns
+                            except OSError:
+                                continue
+                            if dep_mtime_ns > index_mtime_ns:
+                                return True
+                    elif entry.name in _DEPENDENCY_FILES:
+                        if entry.stat().st_mtime_ns > index_mtime_ns:
+                            return True
+                except OSError:
+                    continue  # Skip entries we can't stat
     except OSError:
         pass  # Can't iterate dir, use cached index
 
@@ -11,12 +11,14 @@ from __future__ import annotations
 import importlib.util
 import json
 import logging
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from core.auth import has_iflow_auth
 from init import resolve_auto_build_dir
-from phase_config import resolve_model
+from phase_config import resolve_model, resolve_model_id
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +28,22 @@ IFLOW_SDK_AVAILABLE = importlib.util.find_spec("iflow_sdk") is not None
 # Default model and thinking configuration
 DEFAULT_THINKING_BUDGET = 10000  # Medium thinking
 
+# Batches whose issues all clear both thresholds skip the LLM call
+TRIVIAL_TITLE_SIMILARITY = 0.8  # Min pairwise Jaccard of title+label tokens
+TRIVIAL_PRIMARY_SIMILARITY = 0.85  # Min embedding similarity to primary issue
+TRIVIAL_CONFIDENCE = 0.9
 
-@dataclass
+# System prompt shared by every validation query
+VALIDATION_SYSTEM_PROMPT = "You are an expert at analyzing GitHub issues and determining if they should be grouped together for a combined fix."
+
+
+@dataclass(slots=True)
 class BatchValidationResult:
-    """Result of batch validation."""
+    """Result of batch validation.
+
+    Slotted because large runs keep one instance per batch; common_theme is
+    interned since the same few themes repeat across many batches.
+    """
 
     batch_id: str
     is_valid: bool
@@ -38,15 +52,48 @@ class BatchValidationResult:
     suggested_splits: list[list[int]] | None  # If invalid, suggest how to split
     common_theme: str  # Refined theme description
 
+    def __post_init__(self) -> None:
+        if isinstance(self.common_theme, str) and self.common_theme:
+            self.common_theme = sys.intern(self.common_theme)
+        elif not self.common_theme:
+            self.common_theme = ""
+
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "batch_id": self.batch_id,
-            "is_valid": self.is_valid,
-            "confidence": self.confidence,
-            "reasoning": self.reasoning,
-            "suggested_splits": self.suggested_splits,
-            "common_theme": self.common_theme,
-        }
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _issue_tokens(issue: dict[str, Any]) -> set[str]:
+    """Normalized title words plus labels for similarity comparison."""
+    tokens = set(issue.get("title", "").lower().split())
+    tokens.update(label.lower() for label in issue.get("labels", []))
+    return tokens
+
+
+def _trivially_valid(issues: list[dict[str, Any]]) -> tuple[bool, float]:
+    """
+    Cheap pre-pass that recognizes obviously coherent batches.
+
+    A batch is trivially valid when every pair of issues has a title+label
+    Jaccard similarity of at least TRIVIAL_TITLE_SIMILARITY and every issue
+    is at least TRIVIAL_PRIMARY_SIMILARITY similar to the primary issue.
+
+    Returns:
+        (is_trivially_valid, confidence) tuple
+    """
+    if any(
+        issue.get("similarity_to_primary", 1.0) < TRIVIAL_PRIMARY_SIMILARITY
+        for issue in issues
+    ):
+        return False, 0.0
+
+    token_sets = [_issue_tokens(issue) for issue in issues]
+    for i, left in enumerate(token_sets):
+        for right in token_sets[i + 1 :]:
+            union = left | right
+            if not union or len(left & right) / len(union) < TRIVIAL_TITLE_SIMILARITY:
+                return False, 0.0
+
+    return True, TRIVIAL_CONFIDENCE
 
 
 VALIDATION_PROMPT = """You are reviewing a batch of GitHub issues that were grouped together by semantic similarity.
@@ -106,6 +153,10 @@ class BatchValidator:
         if not result.is_valid:
             # Split the batch according to suggestions
             new_batches = result.suggested_splits
+
+    Each batch is validated in its own iFlow session. A session keeps its
+    conversation history (and is created with max_turns=1), so sharing one
+    would condition every verdict on the batches validated before it.
     """
 
     def __init__(
@@ -113,8 +164,11 @@ class BatchValidator:
         project_dir: Path | None = None,
         model: str | None = None,
         thinking_budget: int | None = None,
+        skip_trivial: bool = True,
     ):
         self.project_dir = project_dir or Path.cwd()
+        # Disable for audit runs that need every batch reviewed by the model
+        self.skip_trivial = skip_trivial
         auto_build_path = resolve_auto_build_dir(self.project_dir).name
         resolved_model, _, resolved_budget = resolve_model(
             feature="github",
@@ -133,6 +187,19 @@ class BatchValidator:
                 "iflow-sdk not available. Batch validation will be skipped."
             )
 
+    def _create_client(self) -> Any:
+        """Create a fresh iFlow session for one validation query."""
+        # Deferred: pulls in the agents package
+        from core.simple_client import create_simple_client
+
+        return create_simple_client(
+            agent_type="batch_validation",
+            model=resolve_model_id(self.model),
+            system_prompt=VALIDATION_SYSTEM_PROMPT,
+            cwd=self.project_dir,
+            max_thinking_tokens=self.thinking_budget,  # Extended thinking
+        )
+
     def _format_issues(self, issues: list[dict[str, Any]]) -> str:
         """Format issues for the prompt."""
         formatted = []
@@ -180,6 +247,19 @@ class BatchValidator:
                 common_theme=themes[0] if themes else "single issue",
             )
 
+        # Near-identical issues don't need an extended-thinking review
+        if self.skip_trivial:
+            trivially_valid, confidence = _trivially_valid(issues)
+            if trivially_valid:
+                return BatchValidationResult(
+                    batch_id=batch_id,
+                    is_valid=True,
+                    confidence=confidence,
+                    reasoning="Issues are near-identical - model validation skipped",
+                    suggested_splits=None,
+                    common_theme=themes[0] if themes else "",
+                )
+
         # Check if SDK/auth is available
         if not IFLOW_SDK_AVAILABLE:
             logger.warning("iFlow SDK not available, assuming batch is valid")
@@ -191,7 +271,6 @@ class BatchValidator:
                 suggested_splits=None,
                 common_theme=themes[0] if themes else "",
             )
-        from core.auth import has_iflow_auth
 
         if not has_iflow_auth():
             logger.warning("iFlow auth not configured, assuming batch is valid")
@@ -213,19 +292,8 @@ class BatchValidator:
         )
 
         try:
-            # Create iFlow client with extended thinking
-            from core.simple_client import create_simple_client
-            from phase_config import resolve_model_id
-
-            client = create_simple_client(
-                agent_type="batch_validation",
-                model=resolve_model_id(self.model),
-                system_prompt="You are an expert at analyzing GitHub issues and determining if they should be grouped together for a combined fix.",
-                cwd=self.project_dir,
-                max_thinking_tokens=self.thinking_budget,  # Extended thinking
-            )
-
-            async with client:
+            # A new session per batch, so no earlier batch is in its context
+            async with self._create_client() as client:
                 await client.query(prompt)
                 result_text = await self._collect_response(client)
 
@@ -295,7 +363,7 @@ class BatchValidator:
 async def validate_batches(
     batches: list[dict[str, Any]],
     project_dir: Path | None = None,
-    model: str = DEFAULT_MODEL,
+    model: str | None = None,
     thinking_budget: int = DEFAULT_THINKING_BUDGET,
 ) -> list[BatchValidationResult]:
     """
@@ -304,7 +372,7 @@ async def validate_batches(
     Args:
         batches: List of batch dicts with batch_id, primary_issue, issues, common_themes
         project_dir: Project directory for iFlow
-        model: Model to use for validation
+        model: Model to use for validation (None = resolve from project config)
         thinking_budget: Token budget for extended thinking
 
     Returns:
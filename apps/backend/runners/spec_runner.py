@@ -49,6 +49,16 @@ import io
 import os
 from pathlib import Path
 
+# uvloop is optional: a faster event loop for the streamed agent I/O.
+# uvloop.run() needs uvloop >= 0.18; it is not available on Windows.
+try:
+    import uvloop
+
+    _HAS_UVLOOP = hasattr(uvloop, "run")
+except ImportError:
+    uvloop = None
+    _HAS_UVLOOP = False
+
 # Configure safe encoding on Windows BEFORE any imports that might print
 # This handles both TTY and piped output (e.g., from Electron)
 if sys.platform == "win32":
@@ -285,7 +295,8 @@ Examples:
             debug_error("spec_runner", "Failed to write resolvedModel snapshot", error=str(exc))
 
         debug("spec_runner", "Starting spec orchestrator run...")
-        success = asyncio.run(
+        run_async = uvloop.run if _HAS_UVLOOP else asyncio.run
+        success = run_async(
             orchestrator.run(
                 interactive=args.interactive or not task_description,
                 auto_approve=args.auto_approve,
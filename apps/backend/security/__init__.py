@@ -17,6 +17,7 @@ Main functions:
 - validate_command: Standalone validation function for testing
 - get_security_profile: Get or create security profile for a project
 - reset_profile_cache: Reset cached security profile
+- get_command_checker: Compiled allow-rule checker for a security profile
 
 Command parsing:
 - extract_commands: Extract command names from shell strings
@@ -46,6 +47,7 @@ from .parser import (
 
 # Profile management
 from .profile import (
+    get_command_checker,
     get_security_profile,
     reset_profile_cache,
 )
@@ -83,6 +85,7 @@ __all__ = [
     "validate_command",
     "get_security_profile",
     "reset_profile_cache",
+    "get_command_checker",
     # Parsing utilities
     "extract_commands",
     "split_command_segments",
@@ -11,7 +11,7 @@ import os
 from pathlib import Path
 from typing import Any
 
-from project_analyzer import BASE_COMMANDS, SecurityProfile, is_command_allowed
+from project_analyzer import BASE_COMMANDS, SecurityProfile
 
 from .parser import extract_commands, get_command_for_validation, split_command_segments
 from .constants import (
@@ -23,8 +23,7 @@ from .constants import (
     TASK_TYPE_ENV_VAR,
     TEST_PLAN_ENV_VAR,
 )
-from .profile import get_security_profile
-from .validator import VALIDATORS
+from .profile import get_command_checker, get_security_profile
 
 DEFAULT_BLOCKED_TEST_COMMANDS = [
     "npm test",
@@ -230,32 +229,18 @@ async def bash_security_hook(
             "reason": f"Could not parse command for security validation: {command}",
         }
 
-    # Split into segments for per-command validation
+    # Allow-rules are compiled once per profile; each command is then a set
+    # lookup plus an optional validator call
+    check_command = get_command_checker(profile)
 
-    # Get all allowed commands
-    allowed = profile.get_all_allowed_commands()
+    def segment_for(cmd: str) -> str:
+        return get_command_for_validation(cmd, segments) or command
 
     # Check each command against the allowlist
     for cmd in commands:
-        # Check if command is allowed
-        is_allowed, reason = is_command_allowed(cmd, profile)
-
+        is_allowed, reason = check_command(cmd, segment_for)
         if not is_allowed:
-            return {
-                "decision": "block",
-                "reason": reason,
-            }
-
-        # Additional validation for sensitive commands
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return {"decision": "block", "reason": reason}
+            return {"decision": "block", "reason": reason}
 
     return {}
 
@@ -284,20 +269,14 @@ def validate_command(
         return False, "Could not parse command"
 
     segments = split_command_segments(command)
+    check_command = get_command_checker(profile)
+
+    def segment_for(cmd: str) -> str:
+        return get_command_for_validation(cmd, segments) or command
 
     for cmd in commands:
-        is_allowed_result, reason = is_command_allowed(cmd, profile)
-        if not is_allowed_result:
+        is_allowed, reason = check_command(cmd, segment_for)
+        if not is_allowed:
             return False, reason
 
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return False, reason
-
     return True, ""
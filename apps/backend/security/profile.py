@@ -6,17 +6,24 @@ Manages security profiles for projects, including caching and validation.
 Uses project_analyzer to create dynamic security profiles based on detected stacks.
 """
 
+from collections.abc import Callable
 from pathlib import Path
 
 from project_analyzer import (
     SecurityProfile,
     get_or_create_profile,
+    is_command_allowed,
 )
 
 from .constants import (
     ALLOWLIST_FILENAME,
     PROFILE_FILENAME,
 )
+from .validator import VALIDATORS
+
+# Checks one command name; the second argument maps a command name to the
+# command segment its validator should inspect.
+CommandChecker = Callable[[str, Callable[[str], str]], tuple[bool, str]]
 
 # =============================================================================
 # GLOBAL STATE
@@ -29,6 +36,10 @@ _cached_spec_dir: Path | None = None  # Track spec directory for cache key
 _cached_profile_mtime: float | None = None  # Track profile mtime
 _cached_allowlist_mtime: float | None = None  # Track allowlist mtime
 
+# Compiled allow-rules for the most recently checked profile
+_cached_command_checker: CommandChecker | None = None
+_cached_checker_profile: SecurityProfile | None = None
+
 
 def _get_file_mtime(path: Path) -> float | None:
     """Get the modification time of a file, or None if not exists."""
@@ -117,6 +128,59 @@ def get_security_profile(
     return _cached_profile
 
 
+def build_command_checker(profile: SecurityProfile) -> CommandChecker:
+    """
+    Compile a profile's allow-rules into a single check function.
+
+    The allowed-command set is frozen once, so each subsequent check is a set
+    lookup plus an optional validator call. Script paths (``./script.sh``)
+    that miss the set fall back to the full ``is_command_allowed`` rules.
+
+    Args:
+        profile: Security profile to compile
+
+    Returns:
+        Function taking (command name, segment lookup) and returning
+        an (is_allowed, reason) tuple
+    """
+    allowed = frozenset(profile.get_all_allowed_commands())
+    validators = VALIDATORS
+
+    def check(cmd: str, segment_for: Callable[[str], str]) -> tuple[bool, str]:
+        if cmd not in allowed:
+            is_allowed, reason = is_command_allowed(cmd, profile)
+            if not is_allowed:
+                return False, reason
+        validator = validators.get(cmd)
+        if validator is None:
+            return True, ""
+        return validator(segment_for(cmd))
+
+    return check
+
+
+def get_command_checker(profile: SecurityProfile) -> CommandChecker:
+    """
+    Get the compiled command checker for a profile, building it on first use.
+
+    The checker is rebuilt whenever a different profile object is passed in,
+    which happens whenever get_security_profile() invalidates its cache.
+
+    Args:
+        profile: Security profile to check commands against
+
+    Returns:
+        Compiled command checker for the profile
+    """
+    global _cached_command_checker
+    global _cached_checker_profile
+
+    if _cached_command_checker is None or _cached_checker_profile is not profile:
+        _cached_command_checker = build_command_checker(profile)
+        _cached_checker_profile = profile
+    return _cached_command_checker
+
+
 def reset_profile_cache() -> None:
     """Reset the cached profile (useful for testing or re-analysis)."""
     global _cached_profile
@@ -124,8 +188,12 @@ def reset_profile_cache() -> None:
     global _cached_spec_dir
     global _cached_profile_mtime
     global _cached_allowlist_mtime
+    global _cached_command_checker
+    global _cached_checker_profile
     _cached_profile = None
     _cached_project_dir = None
     _cached_spec_dir = None
     _cached_profile_mtime = None
     _cached_allowlist_mtime = None
+    _cached_command_checker = None
+    _cached_checker_profile = None
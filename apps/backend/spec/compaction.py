@@ -127,6 +127,23 @@ def format_phase_summaries(summaries: dict[str, str]) -> str:
     return "\n".join(formatted_parts)
 
 
+# Map phases to their expected output files
+PHASE_OUTPUT_FILES: dict[str, tuple[str, ...]] = {
+    "discovery": ("context.json",),
+    "requirements": ("requirements.json",),
+    "research": ("research.json",),
+    "context": ("context.json",),
+    "quick_spec": ("spec.md",),
+    "spec_writing": ("spec.md",),
+    "self_critique": ("spec.md", "critique_notes.md"),
+    "planning": ("implementation_plan.json",),
+    "validation": (),  # No output files to summarize
+}
+
+# Per-file cap on output passed to the summarizer
+MAX_OUTPUT_FILE_CHARS = 10000
+
+
 def gather_phase_outputs(spec_dir: Path, phase_name: str) -> str:
     """
     Gather output files from a completed phase for summarization.
@@ -140,31 +157,17 @@ def gather_phase_outputs(spec_dir: Path, phase_name: str) -> str:
     """
     outputs = []
 
-    # Map phases to their expected output files
-    phase_outputs: dict[str, list[str]] = {
-        "discovery": ["context.json"],
-        "requirements": ["requirements.json"],
-        "research": ["research.json"],
-        "context": ["context.json"],
-        "quick_spec": ["spec.md"],
-        "spec_writing": ["spec.md"],
-        "self_critique": ["spec.md", "critique_notes.md"],
-        "planning": ["implementation_plan.json"],
-        "validation": [],  # No output files to summarize
-    }
-
-    output_files = phase_outputs.get(phase_name, [])
-
-    for filename in output_files:
-        file_path = spec_dir / filename
-        if file_path.exists():
-            try:
-                content = file_path.read_text()
-                # Limit individual file size
-                if len(content) > 10000:
-                    content = content[:10000] + "\n\n[... file truncated ...]"
-                outputs.append(f"**{filename}**:\n```\n{content}\n```")
-            except Exception:
-                pass  # Skip files that can't be read
+    for filename in PHASE_OUTPUT_FILES.get(phase_name, ()):
+        # Open directly (no exists() probe) and read only what is kept;
+        # missing and unreadable files are skipped
+        try:
+            with open(spec_dir / filename) as f:
+                content = f.read(MAX_OUTPUT_FILE_CHARS + 1)
+        except Exception:
+            continue
+        # Limit individual file size
+        if len(content) > MAX_OUTPUT_FILE_CHARS:
+            content = content[:MAX_OUTPUT_FILE_CHARS] + "\n\n[... file truncated ...]"
+        outputs.append(f"**{filename}**:\n```\n{content}\n```")
 
     return "\n\n".join(outputs) if outputs else ""
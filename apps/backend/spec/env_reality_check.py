@@ -8,16 +8,20 @@ Generates a structured report used by the planning pipeline.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+import copy
 import os
-import shutil
+import stat
 import sys
+import time
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BinaryCheck:
     name: str
     required: bool
@@ -26,74 +30,271 @@ class BinaryCheck:
     reason: str | None = None
 
 
-def _resolve_executable(name: str, env: dict[str, str]) -> str | None:
-    path_env = env.get("PATH")
-    return shutil.which(name, path=path_env) if path_env is not None else shutil.which(name)
+# Executable extensions, split once at import (only Windows uses them)
+_PATHEXT: tuple[str, ...] = (
+    tuple(ext for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if ext)
+    if sys.platform == "win32"
+    else ()
+)
+
+_TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes"})
+_JS_LANGUAGES = frozenset({"javascript", "typescript"})
+
+# The running interpreter cannot change, so it is checked once at import
+_PYTHON_EXECUTABLE = sys.executable
+_PYTHON_FOUND = bool(_PYTHON_EXECUTABLE) and os.path.isfile(_PYTHON_EXECUTABLE)
+
+# Requirement files probed relative to project_dir
+_BACKEND_TEST_REQUIREMENTS = ("apps", "backend", "tests", "requirements-test.txt")
+_PROJECT_TEST_REQUIREMENTS = ("tests", "requirements-test.txt")
+_BACKEND_REQUIREMENTS = ("apps", "backend", "requirements.txt")
+
+# Recent reports keyed by _report_cache_key(), stored with a monotonic timestamp
+_REPORT_CACHE_TTL_SECONDS = 30.0
+_report_cache: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+
+# Resolved executables keyed by (name, PATH), stored with a monotonic timestamp.
+# They expire with reports, so a tool installed mid-session is picked up.
+_which_cache: dict[tuple[str, str | None], tuple[float, str | None]] = {}
+
+
+def _candidate_names(name: str) -> tuple[str, ...]:
+    if not _PATHEXT:
+        return (name,)
+    lowered = name.lower()
+    if any(lowered.endswith(ext.lower()) for ext in _PATHEXT):
+        return (name,)
+    return tuple(name + ext for ext in _PATHEXT)
+
+
+def _is_executable_file(path: str) -> bool:
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _search_dirs(path_env: str | None) -> list[str]:
+    """Split PATH once into its unique, non-empty directories."""
+    search_path = path_env if path_env is not None else os.environ.get("PATH", os.defpath)
+    if not search_path:
+        return []
+    directories: list[str] = []
+    seen_dirs: set[str] = set()
+    for directory in search_path.split(os.pathsep):
+        normalized_dir = os.path.normcase(directory)
+        if directory and normalized_dir not in seen_dirs:
+            seen_dirs.add(normalized_dir)
+            directories.append(directory)
+    return directories
+
+
+def _which_one(candidates: tuple[str, ...], directories: list[str]) -> str | None:
+    for directory in directories:
+        for candidate in candidates:
+            full_path = os.path.join(directory, candidate)
+            if _is_executable_file(full_path):
+                return full_path
+    return None
+
+
+def _which_many(names: list[str], path_env: str | None) -> dict[str, str | None]:
+    """Resolve several executables against a single split of PATH.
+
+    Lookups that miss the per-(name, PATH) memo run concurrently, so slow
+    PATH entries (network mounts, WSL interop) cost the longest walk rather
+    than the sum of all walks.
+    """
+    results: dict[str, str | None] = {}
+    pending: dict[str, tuple[str, ...]] = {}
+    now = time.monotonic()
+    for name in names:
+        cached = _which_cache.get((name, path_env))
+        if cached is not None and now - cached[0] < _REPORT_CACHE_TTL_SECONDS:
+            results[name] = cached[1]
+        else:
+            pending[name] = _candidate_names(name)
+    if not pending:
+        return results
+
+    directories = _search_dirs(path_env)
+    if len(pending) == 1:
+        found = [_which_one(candidates, directories) for candidates in pending.values()]
+    else:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            found = list(
+                executor.map(
+                    lambda candidates: _which_one(candidates, directories),
+                    pending.values(),
+                )
+            )
 
+    for name, path in zip(pending, found):
+        results[name] = path
+        _which_cache[(name, path_env)] = (now, path)
+    return results
 
-def _normalize_env(env: dict[str, str] | None) -> dict[str, str]:
-    if env is None:
-        return dict(os.environ)
-    return dict(env)
+
+def _normalize_env(env: Mapping[str, str] | None) -> Mapping[str, str]:
+    # The check only reads from env, so neither os.environ nor a caller's
+    # mapping is copied; callers must not mutate env while a check runs
+    return os.environ if env is None else env
 
 
 def _collect_languages(project_index: dict[str, Any]) -> set[str]:
-    services = project_index.get("services", {}) or {}
-    languages: set[str] = set()
-    for service in services.values():
-        language = (service.get("language") or "").lower()
-        if language:
-            languages.add(language)
-    return languages
+    services = project_index.get("services") or {}
+    if not services:
+        return set()
+    return {
+        language.lower()
+        for service in services.values()
+        if (language := service.get("language"))
+    }
 
 
-def _iflow_required(requirements: dict[str, Any] | None, env: dict[str, str]) -> bool:
+def _iflow_required(requirements: dict[str, Any] | None, env: Mapping[str, str]) -> bool:
     if requirements and requirements.get("requires_iflow_cli") is True:
         return True
-    env_flag = env.get("AUTO_IFLOW_REQUIRE_IFLOW_CLI", "").lower()
-    return env_flag in {"1", "true", "yes"}
+    return env.get("AUTO_IFLOW_REQUIRE_IFLOW_CLI", "").lower() in _TRUTHY_ENV_VALUES
+
+
+def _stat_info(path: Path) -> tuple[bool, bool, bool]:
+    """Return (exists, is_dir, writable) for a path from a single stat call.
+
+    Owner write bits answer writability for paths we own; anything else
+    (other owners, root) falls back to os.access.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, False, False
+    is_dir = stat.S_ISDIR(st.st_mode)
+    geteuid = getattr(os, "geteuid", None)
+    euid = geteuid() if geteuid is not None else None
+    if euid is not None and euid != 0 and st.st_uid == euid:
+        writable = bool(st.st_mode & stat.S_IWUSR)
+    else:
+        writable = os.access(path, os.W_OK)
+    return True, is_dir, writable
 
 
 def _detect_test_requirements(project_dir: Path) -> tuple[str | None, str | None]:
-    backend_req = project_dir / "apps" / "backend" / "tests" / "requirements-test.txt"
-    if backend_req.exists():
+    backend_req = project_dir.joinpath(*_BACKEND_TEST_REQUIREMENTS)
+    if os.path.isfile(backend_req):
         return str(backend_req), "backend"
-    project_req = project_dir / "tests" / "requirements-test.txt"
-    if project_req.exists():
+    project_req = project_dir.joinpath(*_PROJECT_TEST_REQUIREMENTS)
+    if os.path.isfile(project_req):
         return str(project_req), "project"
     return None, None
 
 
 def _detect_backend_requirements(project_dir: Path) -> tuple[bool, str | None]:
-    backend_req = project_dir / "apps" / "backend" / "requirements.txt"
-    if backend_req.exists():
+    backend_req = project_dir.joinpath(*_BACKEND_REQUIREMENTS)
+    if os.path.isfile(backend_req):
         return True, str(backend_req)
     return False, None
 
 
+def _build_report(
+    errors: list[str], warnings: list[str], checks: dict[str, Any]
+) -> dict[str, Any]:
+    return {
+        "status": "passed" if not errors else "failed",
+        "errors": errors,
+        "warnings": warnings,
+        "checks": checks,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def _path_mtime(path: Path) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _report_cache_key(
+    project_dir: Path,
+    spec_dir: Path,
+    languages: set[str],
+    requirements: dict[str, Any] | None,
+    env: Mapping[str, str],
+) -> tuple[Any, ...]:
+    """Everything a report depends on, including the project_dir mtime."""
+    return (
+        str(project_dir),
+        _path_mtime(project_dir),
+        str(spec_dir),
+        _stat_info(spec_dir),
+        frozenset(languages),
+        bool(requirements and requirements.get("requires_iflow_cli") is True),
+        env.get("PATH"),
+        env.get("AUTO_IFLOW_IFLOW_CLI_PATH"),
+        env.get("IFLOW_CLI_PATH"),
+        env.get("AUTO_IFLOW_REQUIRE_IFLOW_CLI"),
+    )
+
+
+def reset_report_cache() -> None:
+    """Drop memoized reports and PATH lookups (useful for testing)."""
+    _report_cache.clear()
+    _which_cache.clear()
+
+
 def run_env_reality_check(
     project_dir: Path,
     spec_dir: Path,
     project_index: dict[str, Any] | None = None,
     requirements: dict[str, Any] | None = None,
-    env: dict[str, str] | None = None,
+    env: Mapping[str, str] | None = None,
 ) -> dict[str, Any]:
+    """
+    Run the environment reality check, reusing a recent identical report.
+
+    Reports are memoized for _REPORT_CACHE_TTL_SECONDS, keyed by the inputs
+    they depend on; a changed PATH, project_dir mtime, spec_dir state or
+    index language set produces a fresh check.
+    """
     env = _normalize_env(env)
-    project_index = project_index or {}
+    languages = _collect_languages(project_index or {})
+
+    cache_key = _report_cache_key(project_dir, spec_dir, languages, requirements, env)
+    now = time.monotonic()
+    cached = _report_cache.get(cache_key)
+    if cached is not None and now - cached[0] < _REPORT_CACHE_TTL_SECONDS:
+        # Only the check results are reused; created_at reflects this call
+        checked = copy.deepcopy(cached[1])
+        return _build_report(checked["errors"], checked["warnings"], checked["checks"])
+
+    report = _run_checks(project_dir, spec_dir, languages, requirements, env)
+    for key in [
+        key
+        for key, (stored_at, _) in _report_cache.items()
+        if now - stored_at >= _REPORT_CACHE_TTL_SECONDS
+    ]:
+        del _report_cache[key]
+    _report_cache[cache_key] = (now, report)
+    return copy.deepcopy(report)
+
+
+def _run_checks(
+    project_dir: Path,
+    spec_dir: Path,
+    languages: set[str],
+    requirements: dict[str, Any] | None,
+    env: Mapping[str, str],
+) -> dict[str, Any]:
+    path_env = env.get("PATH")
 
     errors: list[str] = []
     warnings: list[str] = []
     checks: dict[str, Any] = {}
 
-    project_exists = project_dir.exists()
-    project_is_dir = project_dir.is_dir()
+    project_exists, project_is_dir, _ = _stat_info(project_dir)
     if not project_exists:
         errors.append("project_dir does not exist")
     if project_exists and not project_is_dir:
         errors.append("project_dir is not a directory")
 
-    spec_exists = spec_dir.exists()
-    spec_writable = os.access(spec_dir, os.W_OK) if spec_exists else False
+    spec_exists, _, spec_writable = _stat_info(spec_dir)
     if not spec_exists:
         errors.append("spec_dir does not exist")
     if spec_exists and not spec_writable:
@@ -108,23 +309,38 @@ def run_env_reality_check(
         "spec_writable": spec_writable,
     }
 
-    languages = _collect_languages(project_index)
+    # Nothing below can pass without a project directory, so skip the
+    # PATH walks and requirement probes on this failure path
+    if not project_exists:
+        return _build_report(errors, warnings, checks)
+
     binaries: list[BinaryCheck] = []
 
+    requires_js = not languages.isdisjoint(_JS_LANGUAGES)
+    iflow_path_override = env.get("AUTO_IFLOW_IFLOW_CLI_PATH") or env.get("IFLOW_CLI_PATH")
+
+    # Resolve every binary needed from PATH in a single walk
+    lookup_names = ["git"]
+    if requires_js:
+        lookup_names += ["node", "npm"]
+    if not iflow_path_override:
+        lookup_names.append("iflow")
+    resolved = _which_many(lookup_names, path_env)
+
+    git_path = resolved["git"]
     binaries.append(
         BinaryCheck(
             name="git",
             required=True,
-            path=_resolve_executable("git", env),
-            found=_resolve_executable("git", env) is not None,
+            path=git_path,
+            found=git_path is not None,
             reason="git is required for worktrees and merge",
         )
     )
 
-    requires_js = bool({"javascript", "typescript"} & languages)
     if requires_js:
-        node_path = _resolve_executable("node", env)
-        npm_path = _resolve_executable("npm", env)
+        node_path = resolved["node"]
+        npm_path = resolved["npm"]
         binaries.append(
             BinaryCheck(
                 name="node",
@@ -144,38 +360,37 @@ def run_env_reality_check(
             )
         )
 
-    requires_python = bool("python" in languages) or True
+    requires_python = "python" in languages
     if requires_python:
-        python_exec = sys.executable
         binaries.append(
             BinaryCheck(
                 name="python",
                 required=True,
-                path=python_exec,
-                found=bool(python_exec),
+                path=_PYTHON_EXECUTABLE,
+                found=_PYTHON_FOUND,
                 reason="python is required for backend pipeline",
             )
         )
 
-    iflow_path_override = env.get("AUTO_IFLOW_IFLOW_CLI_PATH") or env.get("IFLOW_CLI_PATH")
+    iflow_required = _iflow_required(requirements, env)
     if iflow_path_override:
-        override_path = Path(iflow_path_override).expanduser()
-        found_override = override_path.exists()
+        override_path = os.path.expanduser(iflow_path_override)
+        found_override = os.path.isfile(override_path)
         binaries.append(
             BinaryCheck(
                 name="iflow",
-                required=_iflow_required(requirements, env),
-                path=str(override_path),
+                required=iflow_required,
+                path=override_path,
                 found=found_override,
                 reason="iflow CLI path override",
             )
         )
     else:
-        iflow_path = _resolve_executable("iflow", env)
+        iflow_path = resolved["iflow"]
         binaries.append(
             BinaryCheck(
                 name="iflow",
-                required=_iflow_required(requirements, env),
+                required=iflow_required,
                 path=iflow_path,
                 found=iflow_path is not None,
                 reason="iflow CLI on PATH",
@@ -184,10 +399,11 @@ def run_env_reality_check(
 
     binary_payload: list[dict[str, Any]] = []
     for check in binaries:
-        if check.required and not check.found:
-            errors.append(f"required binary missing: {check.name}")
-        elif not check.required and not check.found:
-            warnings.append(f"optional binary missing: {check.name}")
+        if not check.found:
+            if check.required:
+                errors.append(f"required binary missing: {check.name}")
+            else:
+                warnings.append(f"optional binary missing: {check.name}")
         binary_payload.append(
             {
                 "name": check.name,
@@ -199,7 +415,7 @@ def run_env_reality_check(
         )
 
     checks["binaries"] = binary_payload
-    checks["languages"] = sorted(languages)
+    checks["languages"] = sorted(languages) if languages else []
 
     requirements_path, requirements_source = _detect_test_requirements(project_dir)
     backend_requirements_ok, backend_requirements_path = _detect_backend_requirements(project_dir)
@@ -219,11 +435,4 @@ def run_env_reality_check(
         "note": "Backend dependencies source",
     }
 
-    status = "passed" if not errors else "failed"
-    return {
-        "status": status,
-        "errors": errors,
-        "warnings": warnings,
-        "checks": checks,
-        "created_at": datetime.now().isoformat(),
-    }
+    return _build_report(errors, warnings, checks)
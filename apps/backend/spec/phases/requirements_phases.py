@@ -5,12 +5,17 @@ Requirements and Research Phase Implementations
 Phases for requirements gathering, historical context, and research.
 """
 
-import json
+import asyncio
+import contextlib
+import hashlib
 import re
+from collections.abc import Callable
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from core import json_io
 from task_logger import LogEntryType, LogPhase
 
 from .. import env_reality_check, requirements, validator
@@ -20,136 +25,300 @@ from .models import MAX_RETRIES, PhaseResult
 if TYPE_CHECKING:
     pass
 
+# Absolute path-like tokens in a task description. The last character may not
+# be trailing punctuation (closing paren, period, comma, semicolon, quote), so
+# matches come out already trimmed
+_TASK_PATH_RE = re.compile(r"""/\S*[^\s).,;"']""")
+
+# Workflow types that decide intent / task type without scanning the text
+_WORKFLOW_INTENTS = {
+    "investigation": "investigate",
+    "research": "investigate",
+    "migration": "change",
+    "bugfix": "change",
+    "bug_fix": "change",
+    "fix": "change",
+    "feature": "change",
+}
+_WORKFLOW_TASK_TYPES = {
+    "docs": "content",
+    "documentation": "content",
+    "content": "content",
+    "audit": "audit",
+    "analysis": "analysis",
+    "investigation": "analysis",
+    "research": "analysis",
+    "plan": "plan",
+    "planning": "plan",
+}
+
+# Task-type keywords in priority order: the first category with any keyword
+# present in the description wins, wherever the keyword appears
+_TASK_TYPE_KEYWORDS = {
+    "analysis": ["analysis", "analyze", "investigate", "root cause", "diagnose"],
+    "audit": ["audit", "compliance", "security review", "risk review"],
+    "plan": ["plan", "roadmap", "strategy", "proposal", "design doc"],
+    "content": ["docs", "documentation", "readme", "changelog", "write"],
+}
+_TASK_TYPE_PRIORITY = {task_type: rank for rank, task_type in enumerate(_TASK_TYPE_KEYWORDS)}
+
+
+def _keyword_alternation(keywords: list[str]) -> str:
+    return "|".join(re.escape(keyword) for keyword in keywords)
+
+
+# One scan finds every task-type keyword; the lookahead keeps matches
+# zero-width so overlapping keywords from different categories are all seen.
+# Keyword patterns are case-insensitive, so descriptions are never lowercased.
+_TASK_TYPE_RE = re.compile(
+    "(?="
+    + "|".join(
+        f"(?P<{task_type}>{_keyword_alternation(keywords)})"
+        for task_type, keywords in _TASK_TYPE_KEYWORDS.items()
+    )
+    + ")",
+    re.IGNORECASE,
+)
+_CREATE_INTENT_RE = re.compile(
+    _keyword_alternation(["create", "add", "build", "introduce"]), re.IGNORECASE
+)
+_DELETE_INTENT_RE = re.compile(
+    _keyword_alternation(["delete", "remove", "drop"]), re.IGNORECASE
+)
+_INVESTIGATE_INTENT_RE = re.compile(
+    _keyword_alternation(["investigate", "research", "analyze"]), re.IGNORECASE
+)
+_CRITERIA_HEADER_RE = re.compile(r"(?:acceptance|success) criteria", re.IGNORECASE)
+
+
+# The keyword scans below are pure functions of the description text, so the
+# phases (and repeated pipeline runs in one process) share their results
+
+
+@lru_cache(maxsize=128)
+def _intent_from_text(task_description: str) -> str:
+    if _CREATE_INTENT_RE.search(task_description):
+        return "create"
+    if _DELETE_INTENT_RE.search(task_description):
+        return "delete"
+    if _INVESTIGATE_INTENT_RE.search(task_description):
+        return "investigate"
+    return "change"
+
+
+@lru_cache(maxsize=128)
+def _task_type_from_text(task_description: str) -> str:
+    best = "code"
+    best_rank = len(_TASK_TYPE_PRIORITY)
+    for match in _TASK_TYPE_RE.finditer(task_description):
+        rank = _TASK_TYPE_PRIORITY[match.lastgroup]
+        if rank < best_rank:
+            best, best_rank = match.lastgroup, rank
+            if rank == 0:
+                break
+    return best
+
+
+@lru_cache(maxsize=128)
+def _acceptance_from_text(task_description: str) -> tuple[str, ...]:
+    # Most descriptions have no criteria header; bail out before splitting
+    header = _CRITERIA_HEADER_RE.search(task_description)
+    if header is None:
+        return ()
+
+    # The first piece is the rest of the header line; bullets follow it
+    lines = iter(task_description[header.end():].splitlines())
+    next(lines, None)
+
+    items: list[str] = []
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            if items:
+                break
+            continue
+        if line.startswith(('-', '*')):
+            candidate = line.lstrip('-* ').strip()
+            if candidate:
+                items.append(candidate)
+            continue
+        if items:
+            break
+
+    return tuple(items)
+
 
 class RequirementsPhaseMixin:
     """Mixin for requirements and research phase methods."""
 
-    _TASK_TYPE_KEYWORDS = {
-        "analysis": ["analysis", "analyze", "investigate", "root cause", "diagnose"],
-        "audit": ["audit", "compliance", "security review", "risk review"],
-        "plan": ["plan", "roadmap", "strategy", "proposal", "design doc"],
-        "content": ["docs", "documentation", "readme", "changelog", "write"],
-    }
-
     def _infer_intent(self, task_description: str, workflow_type: str | None) -> str:
         """Infer intent for scope contract based on workflow type and task text."""
-        workflow = (workflow_type or "").lower()
-        if workflow in {"investigation", "research"}:
-            return "investigate"
-        if workflow in {"migration"}:
-            return "change"
-        if workflow in {"bugfix", "bug_fix", "fix"}:
-            return "change"
-        if workflow in {"feature"}:
-            return "change"
-
-        lowered = (task_description or "").lower()
-        if any(word in lowered for word in ["create", "add", "build", "introduce"]):
-            return "create"
-        if any(word in lowered for word in ["delete", "remove", "drop"]):
-            return "delete"
-        if any(word in lowered for word in ["investigate", "research", "analyze"]):
-            return "investigate"
-        return "change"
+        intent = _WORKFLOW_INTENTS.get((workflow_type or "").lower())
+        if intent is not None:
+            return intent
+
+        return _intent_from_text(task_description or "")
 
     def _infer_task_type(self, task_description: str, workflow_type: str | None) -> str:
-        workflow = (workflow_type or "").lower().strip()
-        if workflow in {"docs", "documentation", "content"}:
-            return "content"
-        if workflow in {"audit"}:
-            return "audit"
-        if workflow in {"analysis", "investigation", "research"}:
-            return "analysis"
-        if workflow in {"plan", "planning"}:
-            return "plan"
-
-        lowered = (task_description or "").lower()
-        for task_type, keywords in self._TASK_TYPE_KEYWORDS.items():
-            if any(keyword in lowered for keyword in keywords):
-                return task_type
-        return "code"
+        task_type = _WORKFLOW_TASK_TYPES.get((workflow_type or "").lower().strip())
+        if task_type is not None:
+            return task_type
+
+        return _task_type_from_text(task_description or "")
+
+    @cached_property
+    def _project_dir_resolved(self) -> Path:
+        """Project root with symlinks resolved, computed once per executor."""
+        return Path(self.project_dir).resolve()
+
+    # Spec artifact paths, joined once per executor (spec_dir never changes)
+
+    @cached_property
+    def _project_index_file(self) -> Path:
+        return self.spec_dir / "project_index.json"
+
+    @cached_property
+    def _preflight_report_file(self) -> Path:
+        return self.spec_dir / "scope_preflight_report.json"
+
+    @cached_property
+    def _env_reality_file(self) -> Path:
+        return self.spec_dir / "env_reality_check.json"
+
+    @cached_property
+    def _scope_file(self) -> Path:
+        return self.spec_dir / "scope_contract.json"
+
+    @cached_property
+    def _task_intake_file(self) -> Path:
+        return self.spec_dir / "task_intake.json"
+
+    @cached_property
+    def _review_file(self) -> Path:
+        return self.spec_dir / "scope_review.json"
+
+    @cached_property
+    def _hints_file(self) -> Path:
+        return self.spec_dir / "graph_hints.json"
+
+    @cached_property
+    def _requirements_file(self) -> Path:
+        return self.spec_dir / "requirements.json"
+
+    @cached_property
+    def _research_file(self) -> Path:
+        return self.spec_dir / "research.json"
 
     def _extract_task_paths(self, task_description: str) -> list[str]:
-        if not task_description:
+        # Most descriptions name no absolute path; skip the resolve and regex
+        if not task_description or "/" not in task_description:
+            return []
+        try:
+            project_root = self._project_dir_resolved
+        except OSError:
             return []
-        matches = re.findall(r"/[^\\s]+", task_description)
         results: list[str] = []
-        for raw in matches:
-            cleaned = raw.rstrip(").,;\"'")
+        for raw in _TASK_PATH_RE.findall(task_description):
             try:
-                path = Path(cleaned).resolve()
+                path = Path(raw).resolve()
             except OSError:
                 continue
             try:
-                rel = path.relative_to(Path(self.project_dir).resolve())
-            except (ValueError, OSError):
+                rel = path.relative_to(project_root)
+            except ValueError:
                 continue
             results.append(str(rel))
         return results
 
     def _get_noncode_allowed_paths(self, task_description: str) -> list[str]:
-        allowed = ["NEW-PLANS/**", "CODEX-*.md", "docs/**", "README.md"]
-        allowed.extend(self._extract_task_paths(task_description))
+        allowed = [
+            "NEW-PLANS/**",
+            "CODEX-*.md",
+            "docs/**",
+            "README.md",
+            *self._extract_task_paths(task_description),
+        ]
         # Deduplicate while preserving order
-        seen = set()
-        result: list[str] = []
-        for item in allowed:
-            if item and item not in seen:
-                seen.add(item)
-                result.append(item)
-        return result
+        return list(dict.fromkeys(item for item in allowed if item))
+
+    @cached_property
+    def _spec_json_cache(self) -> dict[str, tuple[tuple[int, int], Any]]:
+        """Parsed spec JSON files by name, with the (mtime_ns, size) read."""
+        return {}
+
+    def _read_spec_json_cached(self, name: str, loader: Callable[[], Any]) -> Any:
+        """
+        Return loader()'s result for spec_dir/name, reusing it while the file
+        is unchanged. Cached values are shared between phases; do not mutate.
+        """
+        try:
+            stat = (self.spec_dir / name).stat()
+        except OSError:
+            return loader()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._spec_json_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = loader()
+        self._spec_json_cache[name] = (key, value)
+        return value
+
+    def _load_requirements(self) -> dict | None:
+        """Load requirements.json, parsed at most once per file version."""
+        return self._read_spec_json_cached(
+            "requirements.json", lambda: requirements.load_requirements(self.spec_dir)
+        )
 
     def _load_project_index(self) -> dict:
         """Load project_index.json from spec directory if available."""
-        project_index_file = self.spec_dir / "project_index.json"
-        if project_index_file.exists():
-            try:
-                return json.loads(project_index_file.read_text())
-            except json.JSONDecodeError:
-                return {}
-        return {}
+        return self._read_spec_json_cached("project_index.json", self._read_project_index)
+
+    def _read_project_index(self) -> dict:
+        # Open directly rather than exists()-then-read: one syscall, no race
+        try:
+            return json_io.read_json(self._project_index_file)
+        except (FileNotFoundError, json_io.JSONDecodeError):
+            return {}
 
     def _coerce_list(self, value) -> list[str]:
         """Normalize a value into a list of strings."""
         if value is None:
             return []
         if isinstance(value, list):
-            return [str(item).strip() for item in value if str(item).strip()]
-        if isinstance(value, str) and value.strip():
-            return [value.strip()]
+            # Strip each item once; JSON strings skip the str() round-trip
+            stripped = (
+                item.strip() if isinstance(item, str) else str(item).strip()
+                for item in value
+            )
+            return [item for item in stripped if item]
+        if isinstance(value, str):
+            stripped = value.strip()
+            return [stripped] if stripped else []
         return []
 
     def _infer_acceptance(self, task_description: str) -> list[str]:
         """Infer acceptance criteria from task description when missing."""
         if not task_description:
             return []
+        return list(_acceptance_from_text(task_description))
 
-        lines = [line.strip() for line in task_description.splitlines()]
-        start_idx = None
-        for idx, line in enumerate(lines):
-            lowered = line.lower()
-            if "acceptance criteria" in lowered or "success criteria" in lowered:
-                start_idx = idx + 1
-                break
-
-        if start_idx is None:
-            return []
-
-        items: list[str] = []
-        for line in lines[start_idx:]:
-            if not line:
-                if items:
-                    break
-                continue
-            if line.startswith(('-', '*')):
-                candidate = line.lstrip('-* ').strip()
-                if candidate:
-                    items.append(candidate)
-                continue
-            if items:
-                break
-
-        return items
+    def _validate_scope_contract(self):
+        """
+        Validate scope_contract.json, reusing the last result while the file
+        is byte-identical (senior review re-checks what preflight just wrote).
+        """
+        try:
+            content = self._scope_file.read_bytes()
+        except OSError:
+            # Let the validator report the missing/unreadable file
+            return self.spec_validator.validate_scope_contract()
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        cached = self.__dict__.get("_scope_validation")
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+        result = self.spec_validator.validate_scope_contract()
+        self._scope_validation = (digest, result)
+        return result
 
     def _write_preflight_report(
         self,
@@ -160,7 +329,7 @@ class RequirementsPhaseMixin:
         scope_file: str | None,
     ) -> str | None:
         """Persist scope preflight failure details for UI visibility."""
-        report_file = self.spec_dir / "scope_preflight_report.json"
+        report_file = self._preflight_report_file
         payload = {
             "status": status,
             "errors": errors,
@@ -170,7 +339,7 @@ class RequirementsPhaseMixin:
             "created_at": datetime.now().isoformat(),
         }
         try:
-            report_file.write_text(json.dumps(payload, indent=2))
+            json_io.write_json(report_file, payload)
             return str(report_file)
         except OSError as exc:
             self.task_logger.log_error(
@@ -180,12 +349,15 @@ class RequirementsPhaseMixin:
 
     async def phase_env_reality_check(self) -> PhaseResult:
         """Validate project paths, permissions, and required binaries before preflight."""
-        report_file = self.spec_dir / "env_reality_check.json"
+        report_file = self._env_reality_file
 
-        req = requirements.load_requirements(self.spec_dir) or {}
+        req = self._load_requirements() or {}
         project_index = self._load_project_index()
 
-        result = env_reality_check.run_env_reality_check(
+        # Path/binary probing and the report write are blocking; run them off
+        # the event loop so UI and logger tasks keep progressing
+        result = await asyncio.to_thread(
+            env_reality_check.run_env_reality_check,
             project_dir=self.project_dir,
             spec_dir=self.spec_dir,
             project_index=project_index,
@@ -193,7 +365,7 @@ class RequirementsPhaseMixin:
         )
 
         try:
-            report_file.write_text(json.dumps(result, indent=2))
+            await asyncio.to_thread(json_io.write_json, report_file, result)
         except OSError as exc:
             self.task_logger.log_with_detail(
                 "Env reality check failed while writing report",
@@ -231,15 +403,15 @@ class RequirementsPhaseMixin:
 
     async def phase_preflight(self) -> PhaseResult:
         """Create scope_contract.json with guardrails before planning."""
-        scope_file = self.spec_dir / "scope_contract.json"
+        scope_file = self._scope_file
 
         if scope_file.exists():
-            result = self.spec_validator.validate_scope_contract()
+            result = self._validate_scope_contract()
             if result.valid:
                 self.ui.print_status("scope_contract.json already exists", "success")
                 return PhaseResult("preflight", True, [str(scope_file)], [], 0)
 
-        req = requirements.load_requirements(self.spec_dir) or {}
+        req = self._load_requirements() or {}
         task_description = req.get("task_description", self.task_description or "")
         workflow_type = req.get("workflow_type")
         user_requirements = self._coerce_list(req.get("user_requirements", []))
@@ -279,7 +451,7 @@ class RequirementsPhaseMixin:
         }
 
         try:
-            scope_file.write_text(json.dumps(contract, indent=2))
+            await asyncio.to_thread(json_io.write_json, scope_file, contract)
         except OSError as exc:
             report_path = self._write_preflight_report(
                 "failed",
@@ -300,7 +472,7 @@ class RequirementsPhaseMixin:
                 output_files.append(report_path)
             return PhaseResult("preflight", False, output_files, [str(exc)], 0)
 
-        result = self.spec_validator.validate_scope_contract()
+        result = self._validate_scope_contract()
         if result.valid:
             # Also generate task_intake.json via preflight scoper
             from ..pipeline.preflight_scoper import run_preflight_scoper
@@ -332,7 +504,7 @@ class RequirementsPhaseMixin:
                 return PhaseResult("preflight", False, output_files, [str(exc)], 0)
 
             self.ui.print_status("Created scope_contract.json", "success")
-            output_files = [str(scope_file), str(self.spec_dir / "task_intake.json")]
+            output_files = [str(scope_file), str(self._task_intake_file)]
             return PhaseResult("preflight", True, output_files, [], 0)
 
         report_path = self._write_preflight_report(
@@ -360,10 +532,10 @@ class RequirementsPhaseMixin:
 
     async def phase_senior_review(self) -> PhaseResult:
         """Validate scope contract and write review result."""
-        review_file = self.spec_dir / "scope_review.json"
-        scope_file = self.spec_dir / "scope_contract.json"
+        review_file = self._review_file
+        scope_file = self._scope_file
 
-        result = self.spec_validator.validate_scope_contract()
+        result = self._validate_scope_contract()
         review_payload = {
             "approved": result.valid,
             "errors": result.errors,
@@ -372,7 +544,7 @@ class RequirementsPhaseMixin:
             "created_at": datetime.now().isoformat(),
         }
         try:
-            review_file.write_text(json.dumps(review_payload, indent=2))
+            await asyncio.to_thread(json_io.write_json, review_file, review_payload)
         except OSError as exc:
             return PhaseResult("senior_review", False, [], [str(exc)], 0)
 
@@ -387,7 +559,7 @@ class RequirementsPhaseMixin:
         """Retrieve historical context from Graphiti knowledge graph (if enabled)."""
         from graphiti_providers import get_graph_hints, is_graphiti_enabled
 
-        hints_file = self.spec_dir / "graph_hints.json"
+        hints_file = self._hints_file
 
         if hints_file.exists():
             self.ui.print_status("graph_hints.json already exists", "success")
@@ -418,7 +590,7 @@ class RequirementsPhaseMixin:
         task_query = self.task_description or ""
 
         # If we have requirements, use the full task description
-        req = requirements.load_requirements(self.spec_dir)
+        req = self._load_requirements()
         if req:
             task_query = req.get("task_description", task_query)
 
@@ -448,18 +620,16 @@ class RequirementsPhaseMixin:
             )
 
             # Save hints to file
-            with open(hints_file, "w") as f:
-                json.dump(
-                    {
-                        "enabled": True,
-                        "query": task_query,
-                        "hints": hints,
-                        "hint_count": len(hints),
-                        "created_at": datetime.now().isoformat(),
-                    },
-                    f,
-                    indent=2,
-                )
+            json_io.write_json(
+                hints_file,
+                {
+                    "enabled": True,
+                    "query": task_query,
+                    "hints": hints,
+                    "hint_count": len(hints),
+                    "created_at": datetime.now().isoformat(),
+                },
+            )
 
             if hints:
                 self.ui.print_status(f"Retrieved {len(hints)} graph hints", "success")
@@ -486,7 +656,7 @@ class RequirementsPhaseMixin:
 
     async def phase_requirements(self, interactive: bool = True) -> PhaseResult:
         """Gather requirements from user or task description."""
-        requirements_file = self.spec_dir / "requirements.json"
+        requirements_file = self._requirements_file
 
         if requirements_file.exists():
             self.ui.print_status("requirements.json already exists", "success")
@@ -513,6 +683,12 @@ class RequirementsPhaseMixin:
 
         # Interactive mode
         if interactive:
+            # Warm the project index cache in a worker thread while the user
+            # types. The prompt itself stays on the main thread so Ctrl-C
+            # still interrupts input() directly.
+            prewarm = asyncio.get_running_loop().run_in_executor(
+                None, self._load_project_index
+            )
             try:
                 self.task_logger.log(
                     "Gathering requirements interactively...",
@@ -533,6 +709,9 @@ class RequirementsPhaseMixin:
                 print()
                 self.ui.print_status("Requirements gathering cancelled", "warning")
                 return PhaseResult("requirements", False, [], ["User cancelled"], 0)
+            finally:
+                with contextlib.suppress(OSError):
+                    await prewarm
 
         # Fallback: create minimal requirements
         req = requirements.create_requirements_from_task(
@@ -544,8 +723,8 @@ class RequirementsPhaseMixin:
 
     async def phase_research(self) -> PhaseResult:
         """Research external integrations and validate assumptions."""
-        research_file = self.spec_dir / "research.json"
-        requirements_file = self.spec_dir / "requirements.json"
+        research_file = self._research_file
+        requirements_file = self._requirements_file
 
         if research_file.exists():
             self.ui.print_status("research.json already exists", "success")
@@ -586,11 +765,13 @@ Output your findings to research.json.
                 phase_name="research",
             )
 
-            if success and research_file.exists():
-                self.ui.print_status("Created research.json", "success")
-                return PhaseResult("research", True, [str(research_file)], [], attempt)
+            if success:
+                if research_file.exists():
+                    self.ui.print_status("Created research.json", "success")
+                    return PhaseResult(
+                        "research", True, [str(research_file)], [], attempt
+                    )
 
-            if success and not research_file.exists():
                 validator.create_minimal_research(
                     self.spec_dir,
                     reason="Agent completed but created no findings",
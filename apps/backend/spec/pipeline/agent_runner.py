@@ -6,16 +6,39 @@ Handles the execution of AI agents for the spec creation pipeline.
 """
 
 import asyncio
+import contextlib
+import dataclasses
+import hashlib
 import os
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import TextIO
 
 # Configure safe encoding before any output (fixes Windows encoding errors)
 from ui.capabilities import configure_safe_encoding
 
 configure_safe_encoding()
 
-from core.iflow_client import create_iflow_client, iter_agent_messages, send_agent_message
-from debug import debug, debug_detailed, debug_error, debug_section, debug_success
+from core import json_io
+from core.iflow_client import (
+    create_iflow_client,
+    iter_agent_messages,
+    send_agent_message,
+)
+from debug import (
+    debug,
+    debug_detailed,
+    debug_error,
+    debug_section,
+    debug_success,
+    get_debug_level,
+    is_debug_enabled,
+)
 from security.tool_input_validator import get_safe_tool_input
 from task_logger import (
     LogEntryType,
@@ -23,6 +46,32 @@ from task_logger import (
     TaskLogger,
 )
 
+PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
+
+# Successful responses are cached under spec_dir/AGENT_CACHE_DIR when
+# IFLOW_AGENT_CACHE is set (opt-in: agents write spec files as a side
+# effect, which a replayed response does not reproduce)
+AGENT_CACHE_DIR = ".agent_cache"
+
+
+def _agent_cache_enabled() -> bool:
+    return os.environ.get("IFLOW_AGENT_CACHE", "").lower() in ("true", "1", "yes", "on")
+
+
+def _read_cached_response(cache_file: Path) -> str | None:
+    try:
+        data = json_io.read_json(cache_file)
+    except (OSError, json_io.JSONDecodeError):
+        return None
+    response = data.get("response") if isinstance(data, dict) else None
+    return response if isinstance(response, str) else None
+
+
+def _write_cached_response(cache_file: Path, response: str) -> None:
+    with contextlib.suppress(OSError):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        json_io.write_json(cache_file, {"response": response})
+
 
 def _get_timeout_seconds(env_key: str, default_seconds: float) -> float | None:
     raw = os.environ.get(env_key)
@@ -40,6 +89,272 @@ def _get_timeout_seconds(env_key: str, default_seconds: float) -> float | None:
 STREAM_IDLE_TIMEOUT_SEC = _get_timeout_seconds("IFLOW_STREAM_IDLE_TIMEOUT_SEC", 300.0)
 
 
+class _IdleWatchdog:
+    """
+    Cancels the consuming task when the stream goes quiet.
+
+    Messages only record an arrival time; the single timer re-arms itself
+    for the remaining window when it fires early, instead of a wait_for()
+    Task and timer being created for every message.
+    """
+
+    def __init__(self, timeout: float):
+        self._timeout = timeout
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        self._last_activity = self._loop.time()
+        self._handle = self._loop.call_later(timeout, self._check)
+        self.expired = False
+
+    def touch(self) -> None:
+        self._last_activity = self._loop.time()
+
+    def _check(self) -> None:
+        remaining = self._last_activity + self._timeout - self._loop.time()
+        if remaining > 0:
+            self._handle = self._loop.call_later(remaining, self._check)
+            return
+        self.expired = True
+        self._task.cancel()
+
+    def stop(self) -> None:
+        self._handle.cancel()
+
+
+@lru_cache(maxsize=64)
+def _load_prompt(path: str, mtime_ns: int) -> str:
+    """Read a prompt file; keyed on mtime so edited prompts are re-read."""
+    return Path(path).read_text()
+
+
+# Attribute names SDK versions have used for ToolCallMessage fields, in
+# lookup order
+_TOOL_CALL_ATTRS = {
+    "name": ("tool_name", "name"),
+    "args": ("args", "input"),
+    "id": ("id", "tool_call_id", "call_id"),
+    "output": ("output",),
+    "status": ("status",),
+    "is_error": ("is_error",),
+}
+
+
+@lru_cache(maxsize=32)
+def _tool_call_attrs(msg_cls: type) -> dict[str, tuple[str, ...]]:
+    """
+    Narrow _TOOL_CALL_ATTRS to the names instances of msg_cls can have.
+
+    Probing a missing attribute raises and swallows an AttributeError
+    inside getattr(), so classes that declare their fields (pydantic
+    models, dataclasses) are resolved once per class. Other classes keep
+    every candidate.
+    """
+    fields = getattr(msg_cls, "model_fields", None)
+    config = getattr(msg_cls, "model_config", None)
+    if isinstance(fields, dict) and not (
+        isinstance(config, dict) and config.get("extra") == "allow"
+    ):
+        declared = set(fields)
+    elif dataclasses.is_dataclass(msg_cls):
+        declared = {f.name for f in dataclasses.fields(msg_cls)}
+    else:
+        return _TOOL_CALL_ATTRS
+    declared.update(dir(msg_cls))
+    return {
+        role: tuple(name for name in names if name in declared)
+        for role, names in _TOOL_CALL_ATTRS.items()
+    }
+
+
+def _attr_or(obj, names: tuple[str, ...]):
+    """getattr(obj, a, None) or getattr(obj, b, None) or ... over names."""
+    value = None
+    for name in names:
+        value = getattr(obj, name, None)
+        if value:
+            break
+    return value
+
+
+def _first_set_attr(obj, names: tuple[str, ...], default=None):
+    """The first of names set to something other than None on obj."""
+    for name in names:
+        value = getattr(obj, name, None)
+        if value is not None:
+            return value
+    return default
+
+
+_MISSING = object()
+
+# First matching input key wins: (key, formatter)
+_DISPLAY_RULES = (
+    ("pattern", lambda v: f"pattern: {v}"),
+    ("file_path", lambda v: "..." + v[-47:] if len(v) > 50 else v),
+    ("command", lambda v: v[:47] + "..." if len(v) > 50 else v),
+    ("path", lambda v: v),
+)
+
+
+def _extract_tool_input_display(inp: dict) -> str | None:
+    """Extract meaningful tool input for display.
+
+    Args:
+        inp: The tool input dictionary
+
+    Returns:
+        A formatted string for display, or None
+    """
+    if not isinstance(inp, dict):
+        return None
+
+    for key, format_value in _DISPLAY_RULES:
+        value = inp.get(key, _MISSING)
+        if value is not _MISSING:
+            return format_value(value)
+
+    return None
+
+
+# Tool output above this size is not attached to the log entry
+TOOL_DETAIL_MAX_CHARS = 50000
+_SIZED_RESULT_TYPES = (bytes, bytearray, list, tuple, dict)
+
+
+def _get_tool_detail_content(tool_name: str, result_content: str) -> str | None:
+    """Get detail content for specific tools.
+
+    Args:
+        tool_name: The name of the tool
+        result_content: The result content from the tool
+
+    Returns:
+        Detail content if relevant, otherwise None
+    """
+    if tool_name not in ("Read", "Grep", "Bash", "Edit", "Write"):
+        return None
+
+    if isinstance(result_content, str):
+        result_str = result_content
+    elif (
+        isinstance(result_content, _SIZED_RESULT_TYPES)
+        and len(result_content) >= TOOL_DETAIL_MAX_CHARS
+    ):
+        # The str() of these is at least as long as len(), so a large
+        # result is dropped without building its representation
+        return None
+    else:
+        result_str = str(result_content)
+    if len(result_str) < TOOL_DETAIL_MAX_CHARS:
+        return result_str
+
+    return None
+
+
+# Streamed text is handed to the task logger in batches: every
+# TaskLogger.log() rewrites task_logs.json, which made per-chunk logging
+# quadratic in response length
+TEXT_LOG_BATCH_SIZE = 32
+TEXT_LOG_FLUSH_INTERVAL_SEC = 0.1
+
+
+class _TextLogBatcher:
+    """Buffers streamed agent text and writes it with TaskLogger.log_many."""
+
+    def __init__(self, task_logger: TaskLogger):
+        self._task_logger = task_logger
+        self._pending: list[str] = []
+        self._first_pending_at = 0.0
+
+    def push(self, text: str) -> None:
+        now = time.monotonic()
+        if not self._pending:
+            self._first_pending_at = now
+        self._pending.append(text)
+        if (
+            len(self._pending) >= TEXT_LOG_BATCH_SIZE
+            or now - self._first_pending_at >= TEXT_LOG_FLUSH_INTERVAL_SEC
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._task_logger.log_many(
+            pending,
+            LogEntryType.TEXT,
+            LogPhase.PLANNING,
+            print_to_console=False,
+        )
+
+
+# Streamed text is flushed to stdout on a short timer rather than per chunk,
+# which cost one write() syscall per token
+CONSOLE_FLUSH_INTERVAL_SEC = 0.05
+
+
+class _ConsoleWriter:
+    """Echoes streamed agent text to stdout with coalesced flushes."""
+
+    def __init__(self):
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def write(self, text: str) -> None:
+        sys.stdout.write(text)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                CONSOLE_FLUSH_INTERVAL_SEC, self.flush
+            )
+
+    def flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        sys.stdout.flush()
+
+
+@dataclass
+class _StreamState:
+    """Mutable bookkeeping for one agent response stream."""
+
+    response_chunks: list[str] = field(default_factory=list)
+    response_file: TextIO | None = None
+    # (tool_use_id, tool_name) for tools started but not yet finished
+    pending_tools: deque[tuple[str | None, str]] = field(default_factory=deque)
+    message_count: int = 0
+    tool_count: int = 0
+    text_log: _TextLogBatcher | None = None
+    console: _ConsoleWriter = field(default_factory=_ConsoleWriter)
+    # Resolved once per run so per-message debug_detailed() calls (and
+    # their f-strings and kwargs) are skipped when level 2 is off
+    detailed_debug: bool = False
+
+    def flush_pending(self) -> None:
+        """Write buffered text so it lands before the next non-text output."""
+        self.console.flush()
+        if self.text_log is not None:
+            self.text_log.flush()
+
+    def finish_tool(self, tool_use_id: str | None) -> str | None:
+        """Pop the started tool a result belongs to: by id, else the oldest."""
+        pending = self.pending_tools
+        if not pending:
+            return None
+        if tool_use_id is not None and pending[0][0] != tool_use_id:
+            for index, (pending_id, tool_name) in enumerate(pending):
+                if pending_id == tool_use_id:
+                    del pending[index]
+                    return tool_name
+        return pending.popleft()[1]
+
+    def close(self) -> None:
+        """Flush buffered output and close the response sink, if any."""
+        self.flush_pending()
+        if self.response_file is not None:
+            self.response_file.close()
+
+
 class AgentRunner:
     """Manages agent execution with logging and error handling."""
 
@@ -62,6 +377,14 @@ class AgentRunner:
         self.spec_dir = spec_dir
         self.model = model
         self.task_logger = task_logger
+        self._message_handlers = {
+            "AssistantMessage": self._handle_assistant_message,
+            "ToolCallMessage": self._handle_tool_call_message,
+            "UserMessage": self._handle_user_message,
+            "TaskFinishMessage": self._handle_task_finish_message,
+        }
+        # Resolved handlers by message class (SDK types are matched by name)
+        self._handlers_by_type: dict[type, Callable[..., bool] | None] = {}
 
     async def run_agent(
         self,
@@ -71,6 +394,7 @@ class AgentRunner:
         thinking_budget: int | None = None,
         prior_phase_summaries: str | None = None,
         model: str | None = None,
+        response_sink: Path | None = None,
     ) -> tuple[bool, str]:
         """Run an agent with the given prompt.
 
@@ -80,9 +404,12 @@ class AgentRunner:
             interactive: Whether to run in interactive mode
             thinking_budget: Token budget for extended thinking (None = disabled)
             prior_phase_summaries: Summaries from previous phases for context
+            response_sink: Optional file to stream the response into instead
+                of keeping it in memory; its path is returned as the text
 
         Returns:
-            Tuple of (success, response_text)
+            Tuple of (success, response_text), or (success, sink path) when
+            response_sink is given
         """
         debug_section("agent_runner", f"Spec Agent - {prompt_file}")
         model_to_use = model or self.model
@@ -96,40 +423,43 @@ class AgentRunner:
             interactive=interactive,
         )
 
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / prompt_file
+        prompt_path = PROMPTS_DIR / prompt_file
 
-        if not prompt_path.exists():
+        # The stat and read are blocking, so the prompt is assembled on a
+        # worker thread to keep other coroutines on the loop responsive
+        try:
+            prompt = await asyncio.to_thread(
+                self._build_prompt,
+                prompt_path,
+                prior_phase_summaries,
+                additional_context,
+            )
+        except FileNotFoundError:
             debug_error("agent_runner", f"Prompt file not found: {prompt_path}")
             return False, f"Prompt not found: {prompt_path}"
-
-        # Load prompt
-        prompt = prompt_path.read_text()
         debug_detailed(
             "agent_runner",
-            "Loaded prompt file",
+            "Built prompt",
             prompt_length=len(prompt),
+            summaries_length=len(prior_phase_summaries or ""),
+            context_length=len(additional_context),
         )
 
-        # Add context
-        prompt += f"\n\n---\n\n**Spec Directory**: {self.spec_dir}\n"
-        prompt += f"**Project Directory**: {self.project_dir}\n"
-
-        # Add summaries from previous phases (compaction)
-        if prior_phase_summaries:
-            prompt += f"\n{prior_phase_summaries}\n"
-            debug_detailed(
-                "agent_runner",
-                "Added prior phase summaries",
-                summaries_length=len(prior_phase_summaries),
-            )
-
-        if additional_context:
-            prompt += f"\n{additional_context}\n"
-            debug_detailed(
-                "agent_runner",
-                "Added additional context",
-                context_length=len(additional_context),
-            )
+        cache_file = None
+        if response_sink is None and _agent_cache_enabled():
+            key = hashlib.blake2b(
+                f"{model_to_use}|{thinking_budget}|{prompt_file}|{prompt}".encode(),
+                digest_size=16,
+            ).hexdigest()
+            cache_file = self.spec_dir / AGENT_CACHE_DIR / f"{key}.json"
+            cached = await asyncio.to_thread(_read_cached_response, cache_file)
+            if cached is not None:
+                debug_success(
+                    "agent_runner",
+                    "Using cached agent response",
+                    cache_file=str(cache_file),
+                )
+                return True, cached
 
         # Create client with thinking budget
         debug(
@@ -143,213 +473,91 @@ class AgentRunner:
             enable_thinking=thinking_budget is not None,
         )
 
-        current_tool = None
-        message_count = 0
-        tool_count = 0
+        state = _StreamState(
+            text_log=_TextLogBatcher(self.task_logger) if self.task_logger else None,
+            detailed_debug=is_debug_enabled() and get_debug_level() >= 2,
+        )
 
         try:
+            if response_sink is not None:
+                state.response_file = open(response_sink, "w", encoding="utf-8")
             async with client:
                 debug("agent_runner", "Sending query to agent...")
                 await send_agent_message(client, prompt)
                 debug_success("agent_runner", "Query sent successfully")
 
-                response_text = ""
                 debug("agent_runner", "Starting to receive response stream...")
-                stream_iter = iter_agent_messages(client).__aiter__()
-                while True:
-                    try:
-                        if STREAM_IDLE_TIMEOUT_SEC is None:
-                            msg = await stream_iter.__anext__()
-                        else:
-                            msg = await asyncio.wait_for(
-                                stream_iter.__anext__(),
-                                timeout=STREAM_IDLE_TIMEOUT_SEC,
+                handlers_by_type = self._handlers_by_type
+                # Read the module-level policy once; the loop below only
+                # touches the watchdog and never re-checks the setting
+                idle_timeout = STREAM_IDLE_TIMEOUT_SEC
+                watchdog = (
+                    _IdleWatchdog(idle_timeout) if idle_timeout is not None else None
+                )
+                try:
+                    async for msg in iter_agent_messages(client):
+                        if watchdog is not None:
+                            watchdog.touch()
+                        msg_cls = type(msg)
+                        state.message_count += 1
+                        if state.detailed_debug:
+                            debug_detailed(
+                                "agent_runner",
+                                f"Received message #{state.message_count}",
+                                msg_type=msg_cls.__name__,
                             )
-                    except StopAsyncIteration:
-                        break
-                    except asyncio.TimeoutError:
-                        timeout_display = int(STREAM_IDLE_TIMEOUT_SEC)
-                        message = (
-                            f"No agent output for {timeout_display}s; aborting phase"
-                        )
-                        debug_error(
-                            "agent_runner",
-                            "Agent response timeout",
-                            timeout_seconds=STREAM_IDLE_TIMEOUT_SEC,
-                        )
-                        if self.task_logger:
-                            self.task_logger.log_error(message, LogPhase.PLANNING)
-                        return False, message
 
-                    msg_type = type(msg).__name__
-                    message_count += 1
-                    debug_detailed(
+                        # One identity-hashed dict probe per message; the class
+                        # name is only compared the first time a type is seen.
+                        # A handler returns True when the agent's turn is over.
+                        try:
+                            handler = handlers_by_type[msg_cls]
+                        except KeyError:
+                            handler = self._message_handlers.get(msg_cls.__name__)
+                            handlers_by_type[msg_cls] = handler
+                        if handler is not None and handler(msg, state):
+                            break
+                except asyncio.CancelledError:
+                    if watchdog is None or not watchdog.expired:
+                        raise
+                    # Task.uncancel() is 3.11+; on 3.10 there is no cancel
+                    # count to undo
+                    uncancel = getattr(asyncio.current_task(), "uncancel", None)
+                    if uncancel is not None:
+                        uncancel()
+                    message = f"No agent output for {int(idle_timeout)}s; aborting phase"
+                    debug_error(
                         "agent_runner",
-                        f"Received message #{message_count}",
-                        msg_type=msg_type,
+                        "Agent response timeout",
+                        timeout_seconds=idle_timeout,
                     )
-
-                    if msg_type == "AssistantMessage":
-                        if hasattr(msg, "content") and isinstance(msg.content, list):
-                            for block in msg.content:
-                                block_type = type(block).__name__
-                                if block_type == "TextBlock" and hasattr(block, "text"):
-                                    response_text += block.text
-                                    print(block.text, end="", flush=True)
-                                    if self.task_logger and block.text.strip():
-                                        self.task_logger.log(
-                                            block.text,
-                                            LogEntryType.TEXT,
-                                            LogPhase.PLANNING,
-                                            print_to_console=False,
-                                        )
-                                elif block_type == "ToolUseBlock" and hasattr(
-                                    block, "name"
-                                ):
-                                    tool_name = block.name
-                                    tool_count += 1
-
-                                    # Safely extract tool input (handles None, non-dict, etc.)
-                                    inp = get_safe_tool_input(block)
-                                    tool_input_display = (
-                                        self._extract_tool_input_display(inp)
-                                    )
-
-                                    debug(
-                                        "agent_runner",
-                                        f"Tool call #{tool_count}: {tool_name}",
-                                        tool_input=tool_input_display,
-                                    )
-
-                                    if self.task_logger:
-                                        self.task_logger.tool_start(
-                                            tool_name,
-                                            tool_input_display,
-                                            LogPhase.PLANNING,
-                                            print_to_console=True,
-                                        )
-                                    else:
-                                        print(f"\n[Tool: {tool_name}]", flush=True)
-                                    current_tool = tool_name
-                        else:
-                            text_chunk = None
-                            if hasattr(msg, "chunk") and msg.chunk:
-                                text_chunk = (
-                                    msg.chunk.text
-                                    if hasattr(msg.chunk, "text")
-                                    else str(msg.chunk)
-                                )
-                            elif hasattr(msg, "content") and msg.content:
-                                text_chunk = (
-                                    msg.content
-                                    if isinstance(msg.content, str)
-                                    else str(msg.content)
-                                )
-
-                            if text_chunk:
-                                response_text += text_chunk
-                                print(text_chunk, end="", flush=True)
-                                if self.task_logger and text_chunk.strip():
-                                    self.task_logger.log(
-                                        text_chunk,
-                                        LogEntryType.TEXT,
-                                        LogPhase.PLANNING,
-                                        print_to_console=False,
-                                    )
-
-                    elif msg_type == "ToolCallMessage":
-                        tool_name = getattr(msg, "tool_name", None) or getattr(
-                            msg, "name", None
-                        )
-                        tool_count += 1
-                        tool_args = getattr(msg, "args", None)
-                        if tool_args is None:
-                            tool_args = getattr(msg, "input", None)
-                        tool_input_display = self._extract_tool_input_display(tool_args)
-
-                        debug(
-                            "agent_runner",
-                            f"Tool call #{tool_count}: {tool_name}",
-                            tool_input=tool_input_display,
-                        )
-
-                        if self.task_logger and tool_name:
-                            self.task_logger.tool_start(
-                                tool_name,
-                                tool_input_display,
-                                LogPhase.PLANNING,
-                                print_to_console=True,
-                            )
-                        elif tool_name:
-                            print(f"\n[Tool: {tool_name}]", flush=True)
-                        current_tool = tool_name
-
-                        tool_output = getattr(msg, "output", None)
-                        tool_status = getattr(msg, "status", None)
-                        is_error = getattr(msg, "is_error", False)
-                        if tool_output is not None or tool_status:
-                            output_str = str(tool_output) if tool_output else ""
-                            failed = is_error or (
-                                tool_status in ("error", "failed", "blocked")
-                            )
-                            if self.task_logger and tool_name:
-                                detail_content = self._get_tool_detail_content(
-                                    tool_name, tool_output
-                                )
-                                self.task_logger.tool_end(
-                                    tool_name,
-                                    success=not failed,
-                                    detail=detail_content,
-                                    phase=LogPhase.PLANNING,
-                                )
-                            current_tool = None
-
-                    elif msg_type == "UserMessage" and hasattr(msg, "content"):
-                        for block in msg.content:
-                            block_type = type(block).__name__
-                            if block_type == "ToolResultBlock":
-                                is_error = getattr(block, "is_error", False)
-                                result_content = getattr(block, "content", "")
-                                if is_error:
-                                    debug_error(
-                                        "agent_runner",
-                                        f"Tool error: {current_tool}",
-                                        error=str(result_content)[:200],
-                                    )
-                                else:
-                                    debug_detailed(
-                                        "agent_runner",
-                                        f"Tool success: {current_tool}",
-                                        result_length=len(str(result_content)),
-                                    )
-                                if self.task_logger and current_tool:
-                                    detail_content = self._get_tool_detail_content(
-                                        current_tool, result_content
-                                    )
-                                    self.task_logger.tool_end(
-                                        current_tool,
-                                        success=not is_error,
-                                        detail=detail_content,
-                                        phase=LogPhase.PLANNING,
-                                    )
-                                current_tool = None
-
-                    elif msg_type == "TaskFinishMessage":
-                        debug_success(
-                            "agent_runner",
-                            "Agent finished turn",
-                            stop_reason=getattr(msg, "stop_reason", None),
-                        )
-                        break
-
+                    state.flush_pending()
+                    if self.task_logger:
+                        self.task_logger.log_error(message, LogPhase.PLANNING)
+                    return False, message
+                finally:
+                    if watchdog is not None:
+                        watchdog.stop()
+
+                state.close()
+                if response_sink is not None:
+                    response_text = str(response_sink)
+                    response_length = Path(response_sink).stat().st_size
+                else:
+                    response_text = "".join(state.response_chunks)
+                    response_length = len(response_text)
                 print()
                 debug_success(
                     "agent_runner",
                     "Agent session completed successfully",
-                    message_count=message_count,
-                    tool_count=tool_count,
-                    response_length=len(response_text),
+                    message_count=state.message_count,
+                    tool_count=state.tool_count,
+                    response_length=response_length,
                 )
+                if cache_file is not None:
+                    await asyncio.to_thread(
+                        _write_cached_response, cache_file, response_text
+                    )
                 return True, response_text
 
         except Exception as e:
@@ -358,56 +566,178 @@ class AgentRunner:
                 f"Agent session error: {e}",
                 exception_type=type(e).__name__,
             )
+            state.flush_pending()
             if self.task_logger:
                 self.task_logger.log_error(f"Agent error: {e}", LogPhase.PLANNING)
             return False, str(e)
+        finally:
+            # Covers cancellation; a no-op when a path above already closed
+            state.close()
 
-    @staticmethod
-    def _extract_tool_input_display(inp: dict) -> str | None:
-        """Extract meaningful tool input for display.
-
-        Args:
-            inp: The tool input dictionary
-
-        Returns:
-            A formatted string for display, or None
+    def _build_prompt(
+        self,
+        prompt_path: Path,
+        prior_phase_summaries: str | None,
+        additional_context: str,
+    ) -> str:
+        """Load a prompt file and append the spec context to it.
+
+        Raises:
+            FileNotFoundError: If the prompt file does not exist
         """
-        if not isinstance(inp, dict):
-            return None
-
-        if "pattern" in inp:
-            return f"pattern: {inp['pattern']}"
-        elif "file_path" in inp:
-            fp = inp["file_path"]
-            if len(fp) > 50:
-                fp = "..." + fp[-47:]
-            return fp
-        elif "command" in inp:
-            cmd = inp["command"]
-            if len(cmd) > 50:
-                cmd = cmd[:47] + "..."
-            return cmd
-        elif "path" in inp:
-            return inp["path"]
+        # One stat; the text is cached across phases and retries
+        parts = [
+            _load_prompt(str(prompt_path), prompt_path.stat().st_mtime_ns),
+            f"\n\n---\n\n**Spec Directory**: {self.spec_dir}\n",
+            f"**Project Directory**: {self.project_dir}\n",
+        ]
+        # Add summaries from previous phases (compaction)
+        if prior_phase_summaries:
+            parts.append(f"\n{prior_phase_summaries}\n")
+        if additional_context:
+            parts.append(f"\n{additional_context}\n")
+        return "".join(parts)
+
+    def _log_text(self, text: str, state: _StreamState) -> None:
+        """Record streamed agent text and echo it to the console."""
+        if state.response_file is not None:
+            state.response_file.write(text)
+        else:
+            state.response_chunks.append(text)
+        state.console.write(text)
+        if state.text_log is not None and text and not text.isspace():
+            state.text_log.push(text)
+
+    def _handle_assistant_message(self, msg, state: _StreamState) -> bool:
+        if hasattr(msg, "content") and isinstance(msg.content, list):
+            for block in msg.content:
+                block_type = type(block).__name__
+                if block_type == "TextBlock" and hasattr(block, "text"):
+                    self._log_text(block.text, state)
+                elif block_type == "ToolUseBlock" and hasattr(block, "name"):
+                    tool_name = block.name
+                    state.tool_count += 1
+
+                    # Safely extract tool input (handles None, non-dict, etc.)
+                    inp = get_safe_tool_input(block)
+                    tool_input_display = _extract_tool_input_display(inp)
+
+                    debug(
+                        "agent_runner",
+                        f"Tool call #{state.tool_count}: {tool_name}",
+                        tool_input=tool_input_display,
+                    )
 
-        return None
+                    if self.task_logger:
+                        state.flush_pending()
+                        self.task_logger.tool_start(
+                            tool_name,
+                            tool_input_display,
+                            LogPhase.PLANNING,
+                            print_to_console=True,
+                        )
+                    else:
+                        print(f"\n[Tool: {tool_name}]", flush=True)
+                    state.pending_tools.append((getattr(block, "id", None), tool_name))
+            return False
+
+        text_chunk = None
+        if hasattr(msg, "chunk") and msg.chunk:
+            text_chunk = (
+                msg.chunk.text if hasattr(msg.chunk, "text") else str(msg.chunk)
+            )
+        elif hasattr(msg, "content") and msg.content:
+            text_chunk = (
+                msg.content if isinstance(msg.content, str) else str(msg.content)
+            )
 
-    @staticmethod
-    def _get_tool_detail_content(tool_name: str, result_content: str) -> str | None:
-        """Get detail content for specific tools.
+        if text_chunk:
+            self._log_text(text_chunk, state)
+        return False
 
-        Args:
-            tool_name: The name of the tool
-            result_content: The result content from the tool
+    def _handle_tool_call_message(self, msg, state: _StreamState) -> bool:
+        attrs = _tool_call_attrs(type(msg))
+        tool_name = _attr_or(msg, attrs["name"])
+        state.tool_count += 1
+        tool_args = _first_set_attr(msg, attrs["args"])
+        tool_input_display = _extract_tool_input_display(tool_args)
 
-        Returns:
-            Detail content if relevant, otherwise None
-        """
-        if tool_name not in ("Read", "Grep", "Bash", "Edit", "Write"):
-            return None
+        debug(
+            "agent_runner",
+            f"Tool call #{state.tool_count}: {tool_name}",
+            tool_input=tool_input_display,
+        )
 
-        result_str = str(result_content)
-        if len(result_str) < 50000:
-            return result_str
+        if self.task_logger and tool_name:
+            state.flush_pending()
+            self.task_logger.tool_start(
+                tool_name,
+                tool_input_display,
+                LogPhase.PLANNING,
+                print_to_console=True,
+            )
+        elif tool_name:
+            print(f"\n[Tool: {tool_name}]", flush=True)
+
+        tool_output = _first_set_attr(msg, attrs["output"])
+        tool_status = _first_set_attr(msg, attrs["status"])
+        if tool_output is None and not tool_status:
+            # Still running; the result arrives later as a ToolResultBlock
+            if tool_name:
+                tool_id = _attr_or(msg, attrs["id"])
+                state.pending_tools.append((tool_id, tool_name))
+        else:
+            is_error = _first_set_attr(msg, attrs["is_error"], False)
+            failed = is_error or (tool_status in ("error", "failed", "blocked"))
+            if self.task_logger and tool_name:
+                detail_content = _get_tool_detail_content(tool_name, tool_output)
+                state.flush_pending()
+                self.task_logger.tool_end(
+                    tool_name,
+                    success=not failed,
+                    detail=detail_content,
+                    phase=LogPhase.PLANNING,
+                )
+        return False
+
+    def _handle_user_message(self, msg, state: _StreamState) -> bool:
+        if not hasattr(msg, "content"):
+            return False
+        for block in msg.content:
+            block_type = type(block).__name__
+            if block_type == "ToolResultBlock":
+                current_tool = state.finish_tool(getattr(block, "tool_use_id", None))
+                is_error = getattr(block, "is_error", False)
+                result_content = getattr(block, "content", "")
+                if is_error:
+                    debug_error(
+                        "agent_runner",
+                        f"Tool error: {current_tool}",
+                        error=str(result_content)[:200],
+                    )
+                elif state.detailed_debug:
+                    debug_detailed(
+                        "agent_runner",
+                        f"Tool success: {current_tool}",
+                        result_length=len(str(result_content)),
+                    )
+                if self.task_logger and current_tool:
+                    detail_content = _get_tool_detail_content(
+                        current_tool, result_content
+                    )
+                    state.flush_pending()
+                    self.task_logger.tool_end(
+                        current_tool,
+                        success=not is_error,
+                        detail=detail_content,
+                        phase=LogPhase.PLANNING,
+                    )
+        return False
 
-        return None
+    def _handle_task_finish_message(self, msg, state: _StreamState) -> bool:
+        debug_success(
+            "agent_runner",
+            "Agent finished turn",
+            stop_reason=getattr(msg, "stop_reason", None),
+        )
+        return True
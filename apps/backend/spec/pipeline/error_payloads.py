@@ -4,9 +4,29 @@ Standardized error payloads for pipeline failures.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from spec.phases.models import PhaseResult
 
 
+def _detail_lines(
+    display_name: str, errors: list[str], result: PhaseResult
+) -> Iterator[str]:
+    yield f"Phase: {display_name}"
+    if errors:
+        yield "Errors:"
+        for item in errors:
+            yield f"- {item}"
+    if result.output_files:
+        yield ""
+        yield "Output files:"
+        for item in result.output_files:
+            yield f"- {item}"
+    if result.retries:
+        yield ""
+        yield f"Retries: {result.retries}"
+
+
 def build_phase_error_payload(
     display_name: str, result: PhaseResult
 ) -> tuple[str, str]:
@@ -14,17 +34,7 @@ def build_phase_error_payload(
     reason = errors[0] if errors else "Unknown error"
     content = f"{display_name} failed: {reason}"
 
-    detail_lines = [f"Phase: {display_name}"]
-    if errors:
-        detail_lines.append("Errors:")
-        detail_lines.extend(f"- {item}" for item in errors)
-    if result.output_files:
-        detail_lines.append("")
-        detail_lines.append("Output files:")
-        detail_lines.extend(f"- {item}" for item in result.output_files)
-    if result.retries:
-        detail_lines.append("")
-        detail_lines.append(f"Retries: {result.retries}")
-
-    detail = "\n".join(detail_lines).strip()
+    # strip() only trims an error or file entry that ends in whitespace;
+    # when there is none it returns the joined string without copying
+    detail = "\n".join(_detail_lines(display_name, errors, result)).strip()
     return content, detail
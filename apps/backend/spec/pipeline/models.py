@@ -278,3 +278,29 @@ PHASE_DISPLAY: dict[str, tuple[str, str]] = {
     "planning": ("IMPLEMENTATION PLANNING", Icons.SUBTASK),
     "validation": ("FINAL VALIDATION", Icons.SUCCESS),
 }
+
+# Phases that only read requirements.json and write their own artifact
+# (graph_hints.json / research.json), so adjacent ones can run concurrently
+CONCURRENT_PHASES: frozenset[str] = frozenset({"historical_context", "research"})
+
+
+def group_concurrent_phases(phase_names: list[str]) -> list[list[str]]:
+    """Group consecutive CONCURRENT_PHASES together, keeping overall order.
+
+    Args:
+        phase_names: Phases in the order they would run sequentially
+
+    Returns:
+        Batches of phase names; each batch can be awaited together
+    """
+    batches: list[list[str]] = []
+    for name in phase_names:
+        if (
+            batches
+            and name in CONCURRENT_PHASES
+            and batches[-1][-1] in CONCURRENT_PHASES
+        ):
+            batches[-1].append(name)
+        else:
+            batches.append([name])
+    return batches
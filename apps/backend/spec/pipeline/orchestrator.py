@@ -5,14 +5,16 @@ Spec Orchestrator
 Main orchestration logic for spec creation with dynamic complexity adaptation.
 """
 
-import json
 import asyncio
-import inspect
+import contextlib
+import functools
+import glob
 import os
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 
 from analysis.analyzers import analyze_project
+from core import json_io
 from core.workspace.models import SpecNumberLock
 from init import resolve_auto_build_dir
 from phase_config import get_thinking_budget, resolve_model
@@ -26,6 +28,7 @@ from security.constants import (
 from task_logger import (
     LogEntryType,
     LogPhase,
+    TaskLogger,
     get_task_logger,
 )
 from ui import (
@@ -54,6 +57,7 @@ from .models import (
     cleanup_orphaned_pending_folders,
     create_spec_dir,
     get_specs_dir,
+    group_concurrent_phases,
     rename_spec_dir_from_requirements,
 )
 
@@ -70,6 +74,40 @@ def log_phase_failure(task_logger, display_name: str, result: phases.PhaseResult
     )
 
 
+# Upper bound on waiting for background Linear task creation at the end of a run
+LINEAR_TASK_TIMEOUT_SEC = 120
+
+# Phases run() executes before the complexity-dependent part of the workflow
+PRE_ASSESSMENT_PHASES = ("discovery", "requirements", "preflight", "senior_review")
+
+# Phase summaries generated at once; more would just queue on the API
+MAX_CONCURRENT_SUMMARIES = 3
+
+# Env vars the orchestrator sets for the in-process security hooks
+SCOPED_ENV_VARS = (SPEC_DIR_ENV_VAR, TASK_TYPE_ENV_VAR, NOISE_PROFILE_ENV_VAR)
+
+
+@contextlib.contextmanager
+def _restore_env(keys: Iterable[str]) -> Iterator[None]:
+    """Restore the given env vars to their values on entry when the block exits."""
+    saved = {key: os.environ.get(key) for key in keys}
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            elif os.environ.get(key) != value:
+                os.environ[key] = value
+
+
+def _apply_env(overrides: Mapping[str, str]) -> None:
+    """Set env vars, skipping ones that already hold the value."""
+    for key, value in overrides.items():
+        if os.environ.get(key) != value:
+            os.environ[key] = value
+
+
 class SpecOrchestrator:
     """Orchestrates the spec creation process with dynamic complexity adaptation."""
 
@@ -98,6 +136,7 @@ class SpecOrchestrator:
             use_ai_assessment: Whether to use AI for complexity assessment
         """
         self.project_dir = Path(project_dir)
+        self._auto_build_dir = resolve_auto_build_dir(self.project_dir)
         self.task_description = task_description
         self.model = model
         self.thinking_level = thinking_level
@@ -127,12 +166,11 @@ class SpecOrchestrator:
                 self.spec_dir = create_spec_dir(self.specs_dir, lock)
                 # Create directory inside lock to ensure atomicity
                 self.spec_dir.mkdir(parents=True, exist_ok=True)
-        auto_build_path = resolve_auto_build_dir(self.project_dir).name
         resolved_model, resolved_thinking, _ = resolve_model(
             phase="spec",
             spec_dir=self.spec_dir,
             project_dir=self.project_dir,
-            auto_build_path=auto_build_path,
+            auto_build_path=self._auto_build_dir.name,
             cli_model=model,
             cli_thinking=thinking_level,
         )
@@ -141,12 +179,34 @@ class SpecOrchestrator:
 
         self.validator = SpecValidator(self.spec_dir)
 
-        # Agent runner (initialized when needed)
+        # Agent runner and task logger (initialized when needed)
         self._agent_runner: AgentRunner | None = None
+        self._task_logger: TaskLogger | None = None
+
+        # ((mtime_ns, size), intake, formatted context) of task_intake.json
+        self._task_intake_cache: tuple[tuple[int, int], dict, str] | None = None
 
         # Phase summaries for conversation compaction
         # Stores summaries from completed phases to provide context to subsequent phases
         self._phase_summaries: dict[str, str] = {}
+        # format_phase_summaries() of the above, cleared whenever it changes
+        self._formatted_summaries: str | None = None
+        # Summaries still being generated, in phase order
+        self._pending_summaries: list[tuple[str, asyncio.Task]] = []
+        self._summary_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+        # Linear task creation, running alongside the phases after requirements
+        self._linear_task: asyncio.Task | None = None
+
+    def _get_task_logger(self) -> TaskLogger:
+        """Get the task logger, resolved once for the whole run.
+
+        Holding the instance also keeps logging on the same logger after
+        the spec folder rename, where get_task_logger(self.spec_dir) would
+        see a different path and start a new one.
+        """
+        if self._task_logger is None:
+            self._task_logger = get_task_logger(self.spec_dir)
+        return self._task_logger
 
     def _get_agent_runner(self) -> AgentRunner:
         """Get or create the agent runner.
@@ -155,15 +215,34 @@ class SpecOrchestrator:
             The agent runner instance
         """
         if self._agent_runner is None:
-            task_logger = get_task_logger(self.spec_dir)
             self._agent_runner = AgentRunner(
-                self.project_dir, self.spec_dir, self.model, task_logger
+                self.project_dir, self.spec_dir, self.model, self._get_task_logger()
             )
         return self._agent_runner
 
     def _load_task_intake(self) -> dict:
+        return self._get_task_intake()[0]
+
+    def _get_task_intake(self) -> tuple[dict, str]:
+        """Return task intake and its prompt context, parsed once per file version.
+
+        Every agent call needs the intake context; the file only changes when
+        the preflight scoper writes it, which the stat key picks up.
+        Cached values are shared; do not mutate.
+        """
+        try:
+            stat = (self.spec_dir / "task_intake.json").stat()
+        except OSError:
+            return {}, ""
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._task_intake_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
         intake = load_task_intake(self.spec_dir)
-        return intake if isinstance(intake, dict) else {}
+        intake = intake if isinstance(intake, dict) else {}
+        context = self._format_task_intake_context(intake)
+        self._task_intake_cache = (key, intake, context)
+        return intake, context
 
     def _ensure_task_intake(self) -> dict:
         intake = self._load_task_intake()
@@ -221,9 +300,12 @@ class SpecOrchestrator:
         thinking_budget = get_thinking_budget(self.thinking_level)
 
         # Format prior phase summaries for context
-        prior_summaries = format_phase_summaries(self._phase_summaries)
+        await self._collect_phase_summaries()
+        if self._formatted_summaries is None:
+            self._formatted_summaries = format_phase_summaries(self._phase_summaries)
+        prior_summaries = self._formatted_summaries
 
-        intake_context = self._format_task_intake_context(self._load_task_intake())
+        intake_context = self._get_task_intake()[1]
         if intake_context:
             if additional_context:
                 additional_context = f"{additional_context}\n{intake_context}"
@@ -239,36 +321,51 @@ class SpecOrchestrator:
             model=self.model,
         )
 
-    async def _store_phase_summary(self, phase_name: str) -> None:
-        """Summarize and store phase output for subsequent phases.
+    def _schedule_phase_summary(self, phase_name: str) -> None:
+        """Start summarizing a completed phase's output in the background.
+
+        The outputs are read right away, before the spec folder can be
+        renamed. The summary is an LLM call that overlaps with the phases
+        that follow; _run_agent, the only consumer, waits for it.
 
         Args:
             phase_name: Name of the completed phase
         """
-        try:
-            # Gather outputs from this phase
-            phase_output = gather_phase_outputs(self.spec_dir, phase_name)
-            if not phase_output:
-                return
-
-            # Summarize the output
-            summary = await asyncio.wait_for(
-                summarize_phase_output(
-                    phase_name,
-                    phase_output,
-                    model=self.model,
-                    target_words=500,
-                    project_dir=self.project_dir,
-                ),
-                timeout=60,
-            )
+        phase_output = gather_phase_outputs(self.spec_dir, phase_name)
+        if not phase_output:
+            return
+        task = asyncio.create_task(
+            self._summarize_phase_output(phase_name, phase_output)
+        )
+        self._pending_summaries.append((phase_name, task))
 
-            if summary:
-                self._phase_summaries[phase_name] = summary
+    async def _summarize_phase_output(
+        self, phase_name: str, phase_output: str
+    ) -> str | None:
+        """Summarize phase output, returning None if summarization fails.
 
+        Args:
+            phase_name: Name of the completed phase
+            phase_output: Gathered output files of the phase
+
+        Returns:
+            The summary, or None
+        """
+        try:
+            # The timeout covers the call itself, not waiting for a slot
+            async with self._summary_semaphore:
+                return await asyncio.wait_for(
+                    summarize_phase_output(
+                        phase_name,
+                        phase_output,
+                        model=self.model,
+                        target_words=500,
+                        project_dir=self.project_dir,
+                    ),
+                    timeout=60,
+                )
         except asyncio.TimeoutError:
-            task_logger = get_task_logger(self.spec_dir)
-            task_logger.log(
+            self._get_task_logger().log(
                 "Phase summarization timed out; continuing without summary",
                 LogEntryType.INFO,
                 LogPhase.PLANNING,
@@ -276,6 +373,26 @@ class SpecOrchestrator:
         except Exception as e:
             # Don't fail the pipeline if summarization fails
             print_status(f"Phase summarization skipped: {e}", "warning")
+        return None
+
+    async def _collect_phase_summaries(self) -> None:
+        """Wait for scheduled summaries and store them in phase order."""
+        # Concurrent phases may call this together; each entry is popped by
+        # whichever caller sees it finish first
+        while self._pending_summaries:
+            phase_name, task = self._pending_summaries[0]
+            summary = await task
+            if self._pending_summaries and self._pending_summaries[0][1] is task:
+                self._pending_summaries.pop(0)
+                if summary:
+                    self._phase_summaries[phase_name] = summary
+                    self._formatted_summaries = None
+
+    def _cancel_phase_summaries(self) -> None:
+        """Drop summaries no later phase will consume."""
+        for _, task in self._pending_summaries:
+            task.cancel()
+        self._pending_summaries = []
 
     async def _ensure_fresh_project_index(self) -> None:
         """Ensure project_index.json is up-to-date before spec creation.
@@ -285,10 +402,11 @@ class SpecOrchestrator:
         This ensures QA agents receive accurate project capability information
         for dynamic MCP tool injection.
         """
-        index_file = resolve_auto_build_dir(self.project_dir) / "project_index.json"
+        index_file = self._auto_build_dir / "project_index.json"
+        index_exists = index_file.exists()
 
         if should_refresh_project_index(self.project_dir):
-            if index_file.exists():
+            if index_exists:
                 print_status(
                     "Project dependencies changed, refreshing index...", "progress"
                 )
@@ -296,14 +414,15 @@ class SpecOrchestrator:
                 print_status("Generating project index...", "progress")
 
             try:
-                # Regenerate project index
-                analyze_project(self.project_dir, index_file)
+                # Regenerate project index; this walks the whole project, so
+                # keep it off the event loop
+                await asyncio.to_thread(analyze_project, self.project_dir, index_file)
                 print_status("Project index updated", "success")
             except Exception as e:
                 print_status(f"Project index refresh failed: {e}", "warning")
                 # Don't fail spec creation if indexing fails - continue with cached/missing
         else:
-            if index_file.exists():
+            if index_exists:
                 print_status("Using cached project index", "info")
             # If no index exists and no refresh needed, that's fine - capabilities will be empty
 
@@ -332,7 +451,7 @@ class SpecOrchestrator:
             phases_executed.append(phase_name)
 
             if result.success:
-                await self._store_phase_summary(phase_name)
+                self._schedule_phase_summary(phase_name)
             else:
                 print()
                 print_status(
@@ -375,11 +494,22 @@ class SpecOrchestrator:
         Returns:
             True if spec creation and review completed successfully, False otherwise
         """
+        try:
+            # The env overrides only apply while this run is in progress
+            with _restore_env(SCOPED_ENV_VARS):
+                return await self._run_phases(interactive, auto_approve)
+        finally:
+            # Summaries of the last phases have no consumer left
+            self._cancel_phase_summaries()
+            await self._join_linear_task()
+
+    async def _run_phases(self, interactive: bool, auto_approve: bool) -> bool:
+        """Run all phases and the review checkpoint (see run())."""
         # Import UI module for use in phases
         import ui
 
         # Initialize task logger for planning phase
-        task_logger = get_task_logger(self.spec_dir)
+        task_logger = self._get_task_logger()
         task_logger.start_phase(LogPhase.PLANNING, "Starting spec creation process")
 
         print(
@@ -409,12 +539,14 @@ class SpecOrchestrator:
         results = []
         phase_num = 0
 
-        async def run_phase(name: str, phase_fn: Callable) -> phases.PhaseResult:
+        async def run_phase(
+            name: str, phase_fn: Callable[[], Awaitable[phases.PhaseResult]]
+        ) -> phases.PhaseResult:
             """Run a phase with proper numbering and display.
 
             Args:
                 name: The phase name
-                phase_fn: The phase function to execute
+                phase_fn: The async phase function to execute
 
             Returns:
                 The phase result
@@ -428,9 +560,7 @@ class SpecOrchestrator:
             task_logger.log(
                 f"Starting phase {phase_num}: {display_name}", LogEntryType.INFO
             )
-            result = phase_fn()
-            if inspect.isawaitable(result):
-                result = await result
+            result = await phase_fn()
             if not result.success:
                 log_phase_failure(task_logger, display_name, result)
             return result
@@ -445,11 +575,12 @@ class SpecOrchestrator:
             )
             return False
         # Store summary for subsequent phases (compaction)
-        await self._store_phase_summary("discovery")
+        self._schedule_phase_summary("discovery")
 
         # === PHASE 2: REQUIREMENTS GATHERING ===
         result = await run_phase(
-            "requirements", lambda: phase_executor.phase_requirements(interactive)
+            "requirements",
+            functools.partial(phase_executor.phase_requirements, interactive),
         )
         results.append(result)
         if not result.success:
@@ -461,7 +592,7 @@ class SpecOrchestrator:
             )
             return False
         # Store summary for subsequent phases (compaction)
-        await self._store_phase_summary("requirements")
+        self._schedule_phase_summary("requirements")
 
         # Rename spec folder with better name from requirements
         rename_spec_dir_from_requirements(self.spec_dir)
@@ -474,7 +605,8 @@ class SpecOrchestrator:
             phase_executor.task_description = self.task_description
 
         # === CREATE LINEAR TASK (if enabled) ===
-        await self._create_linear_task_if_enabled()
+        # Nothing downstream needs it, so it runs alongside the next phases
+        self._start_linear_task()
 
         # === PHASE 3: ENV REALITY CHECK ===
         result = await run_phase(
@@ -489,7 +621,7 @@ class SpecOrchestrator:
                 message="Environment reality check failed",
             )
             return False
-        await self._store_phase_summary("env_reality_check")
+        self._schedule_phase_summary("env_reality_check")
 
         # === PHASE 4: SCOPE PREFLIGHT ===
         result = await run_phase("preflight", phase_executor.phase_preflight)
@@ -500,7 +632,7 @@ class SpecOrchestrator:
                 LogPhase.PLANNING, success=False, message="Scope preflight failed"
             )
             return False
-        await self._store_phase_summary("preflight")
+        self._schedule_phase_summary("preflight")
 
         # === PHASE 5: SENIOR REVIEW ===
         result = await run_phase("senior_review", phase_executor.phase_senior_review)
@@ -511,12 +643,12 @@ class SpecOrchestrator:
                 LogPhase.PLANNING, success=False, message="Scope review failed"
             )
             return False
-        await self._store_phase_summary("senior_review")
+        self._schedule_phase_summary("senior_review")
 
         # === PHASE 6: AI COMPLEXITY ASSESSMENT ===
         result = await run_phase(
             "complexity_assessment",
-            lambda: self._phase_complexity_assessment_with_requirements(),
+            self._phase_complexity_assessment_with_requirements,
         )
         results.append(result)
         if not result.success:
@@ -528,10 +660,14 @@ class SpecOrchestrator:
 
         task_intake = self._ensure_task_intake()
         task_type = (task_intake or {}).get("task_type", "code")
-        os.environ[SPEC_DIR_ENV_VAR] = str(self.spec_dir)
-        os.environ[TASK_TYPE_ENV_VAR] = str(task_type)
-        os.environ[NOISE_PROFILE_ENV_VAR] = str(
-            (task_intake or {}).get("noise_profile", "medium")
+        _apply_env(
+            {
+                SPEC_DIR_ENV_VAR: str(self.spec_dir),
+                TASK_TYPE_ENV_VAR: str(task_type),
+                NOISE_PROFILE_ENV_VAR: str(
+                    (task_intake or {}).get("noise_profile", "medium")
+                ),
+            }
         )
 
         # Map of all available phases
@@ -546,14 +682,8 @@ class SpecOrchestrator:
             "quick_spec": phase_executor.phase_quick_spec,
         }
 
+        phases_executed = [*PRE_ASSESSMENT_PHASES, "complexity_assessment"]
         if task_type != "code":
-            phases_executed = [
-                "discovery",
-                "requirements",
-                "preflight",
-                "senior_review",
-                "complexity_assessment",
-            ]
             return await self._run_noncode_pipeline(
                 phase_executor,
                 run_phase,
@@ -564,17 +694,8 @@ class SpecOrchestrator:
             )
 
         # Get remaining phases to run based on complexity
-        all_phases_to_run = self.assessment.phases_to_run()
         phases_to_run = [
-            p
-            for p in all_phases_to_run
-            if p
-            not in [
-                "discovery",
-                "requirements",
-                "preflight",
-                "senior_review",
-            ]
+            p for p in self.assessment.phases_to_run() if p not in PRE_ASSESSMENT_PHASES
         ]
 
         print()
@@ -584,49 +705,51 @@ class SpecOrchestrator:
         print(f"  {muted('Remaining phases:')} {', '.join(phases_to_run)}")
         print()
 
-        phases_executed = [
-            "discovery",
-            "requirements",
-            "preflight",
-            "senior_review",
-            "complexity_assessment",
-        ]
-        for phase_name in phases_to_run:
-            if phase_name not in all_phases:
-                print_status(f"Unknown phase: {phase_name}, skipping", "warning")
-                continue
+        for batch in group_concurrent_phases(phases_to_run):
+            runnable = []
+            for phase_name in batch:
+                if phase_name not in all_phases:
+                    print_status(f"Unknown phase: {phase_name}, skipping", "warning")
+                    continue
+                runnable.append(phase_name)
+
+            # Independent phases (e.g. Graphiti lookup + research agent)
+            # overlap their network/LLM latency instead of running back to back
+            batch_results = await asyncio.gather(
+                *(run_phase(name, all_phases[name]) for name in runnable)
+            )
 
-            result = await run_phase(phase_name, all_phases[phase_name])
-            results.append(result)
-            phases_executed.append(phase_name)
+            for phase_name, result in zip(runnable, batch_results):
+                results.append(result)
+                phases_executed.append(phase_name)
 
-            # Store summary for subsequent phases (compaction)
-            if result.success:
-                await self._store_phase_summary(phase_name)
+                # Store summary for subsequent phases (compaction)
+                if result.success:
+                    self._schedule_phase_summary(phase_name)
 
-            if not result.success:
-                print()
-                print_status(
-                    f"Phase '{phase_name}' failed after {result.retries} retries",
-                    "error",
-                )
-                print(f"  {muted('Errors:')}")
-                for err in result.errors:
-                    print(f"    {icon(Icons.ARROW_RIGHT)} {err}")
-                print()
-                print_status(
-                    "Spec creation incomplete. Fix errors and retry.", "warning"
-                )
-                task_logger.log(
-                    f"Phase '{phase_name}' failed: {'; '.join(result.errors)}",
-                    LogEntryType.ERROR,
-                )
-                task_logger.end_phase(
-                    LogPhase.PLANNING,
-                    success=False,
-                    message=f"Phase {phase_name} failed",
-                )
-                return False
+                if not result.success:
+                    print()
+                    print_status(
+                        f"Phase '{phase_name}' failed after {result.retries} retries",
+                        "error",
+                    )
+                    print(f"  {muted('Errors:')}")
+                    for err in result.errors:
+                        print(f"    {icon(Icons.ARROW_RIGHT)} {err}")
+                    print()
+                    print_status(
+                        "Spec creation incomplete. Fix errors and retry.", "warning"
+                    )
+                    task_logger.log(
+                        f"Phase '{phase_name}' failed: {'; '.join(result.errors)}",
+                        LogEntryType.ERROR,
+                    )
+                    task_logger.end_phase(
+                        LogPhase.PLANNING,
+                        success=False,
+                        message=f"Phase {phase_name} failed",
+                    )
+                    return False
 
         # Summary
         self._print_completion_summary(results, phases_executed)
@@ -639,6 +762,28 @@ class SpecOrchestrator:
         # === HUMAN REVIEW CHECKPOINT ===
         return self._run_review_checkpoint(auto_approve)
 
+    def _start_linear_task(self) -> None:
+        """Start Linear task creation in the background, once per run."""
+        if self._linear_task is None:
+            self._linear_task = asyncio.create_task(
+                self._create_linear_task_if_enabled()
+            )
+
+    async def _join_linear_task(self) -> None:
+        """Wait for background Linear task creation, if it was started."""
+        task, self._linear_task = self._linear_task, None
+        if task is None:
+            return
+        try:
+            await asyncio.wait_for(task, timeout=LINEAR_TASK_TIMEOUT_SEC)
+        except TimeoutError:
+            print_status(
+                "Linear task creation timed out (continuing without)", "warning"
+            )
+        except Exception as e:
+            # Linear is optional; don't fail the pipeline over it
+            print_status(f"Linear task creation failed: {e}", "warning")
+
     async def _create_linear_task_if_enabled(self) -> None:
         """Create a Linear task if Linear integration is enabled."""
         from linear_updater import create_linear_task, is_linear_enabled
@@ -665,12 +810,12 @@ class SpecOrchestrator:
         Returns:
             The phase result
         """
-        task_logger = get_task_logger(self.spec_dir)
+        task_logger = self._get_task_logger()
         assessment_file = self.spec_dir / "complexity_assessment.json"
         requirements_file = self.spec_dir / "requirements.json"
 
         # Load requirements for full context
-        requirements_context = self._load_requirements_context(requirements_file)
+        requirements_context = await self._load_requirements_context(requirements_file)
 
         if self.complexity_override:
             # Manual override
@@ -680,7 +825,7 @@ class SpecOrchestrator:
             self.assessment = await self._run_ai_assessment(task_logger)
         else:
             # Use heuristic assessment
-            self.assessment = self._heuristic_assessment()
+            self.assessment = await self._heuristic_assessment()
             self._print_assessment_info()
 
         # Show what phases will run
@@ -694,7 +839,7 @@ class SpecOrchestrator:
             "complexity_assessment", True, [str(assessment_file)], [], 0
         )
 
-    def _load_requirements_context(self, requirements_file: Path) -> str:
+    async def _load_requirements_context(self, requirements_file: Path) -> str:
         """Load requirements context from file.
 
         Args:
@@ -703,13 +848,14 @@ class SpecOrchestrator:
         Returns:
             Formatted requirements context string
         """
-        if not requirements_file.exists():
+        # Read off the event loop so background summaries keep streaming
+        try:
+            req = await asyncio.to_thread(json_io.read_json, requirements_file)
+        except FileNotFoundError:
             return ""
 
-        with open(requirements_file) as f:
-            req = json.load(f)
-            self.task_description = req.get("task_description", self.task_description)
-            return f"""
+        self.task_description = req.get("task_description", self.task_description)
+        return f"""
 **Task Description**: {req.get("task_description", "Not provided")}
 **Workflow Type**: {req.get("workflow_type", "Not specified")}
 **Services Involved**: {", ".join(req.get("services_involved", []))}
@@ -765,7 +911,7 @@ class SpecOrchestrator:
             print_status(
                 "AI assessment failed, falling back to heuristics...", "warning"
             )
-            return self._heuristic_assessment()
+            return await self._heuristic_assessment()
 
     def _print_assessment_info(
         self, assessment: complexity.ComplexityAssessment | None = None
@@ -800,17 +946,17 @@ class SpecOrchestrator:
         for i, phase in enumerate(phase_list, 1):
             print(f"    {i}. {phase}")
 
-    def _heuristic_assessment(self) -> complexity.ComplexityAssessment:
+    async def _heuristic_assessment(self) -> complexity.ComplexityAssessment:
         """Fall back to heuristic-based complexity assessment.
 
         Returns:
             The complexity assessment
         """
-        project_index = {}
-        auto_build_index = self.project_dir / ".auto-iflow" / "project_index.json"
-        if auto_build_index.exists():
-            with open(auto_build_index) as f:
-                project_index = json.load(f)
+        auto_build_index = self._auto_build_dir / "project_index.json"
+        try:
+            project_index = await asyncio.to_thread(json_io.read_json, auto_build_index)
+        except FileNotFoundError:
+            project_index = {}
 
         analyzer = complexity.ComplexityAnalyzer(project_index)
         return analyzer.analyze(self.task_description or "")
@@ -904,14 +1050,16 @@ class SpecOrchestrator:
         result = rename_spec_dir_from_requirements(self.spec_dir)
         # Update self.spec_dir if it was renamed
         if result and self.spec_dir.name.endswith("-pending"):
-            # Find the renamed directory
-            parent = self.spec_dir.parent
-            prefix = self.spec_dir.name[:4]  # e.g., "001-"
-            for candidate in parent.iterdir():
-                if (
-                    candidate.name.startswith(prefix)
-                    and "pending" not in candidate.name
-                ):
-                    self.spec_dir = candidate
-                    break
+            # Find the renamed directory among siblings sharing the number prefix
+            prefix = glob.escape(self.spec_dir.name[:4])  # e.g., "001-"
+            renamed = next(
+                (
+                    candidate
+                    for candidate in self.spec_dir.parent.glob(f"{prefix}*")
+                    if "pending" not in candidate.name
+                ),
+                None,
+            )
+            if renamed is not None:
+                self.spec_dir = renamed
         return result
@@ -7,10 +7,14 @@ Generates task_intake.json for routing, noise control, and proof gating.
 
 from __future__ import annotations
 
-import json
+import re
+from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
 
+from core import json_io
 from init import resolve_auto_build_dir
 
 from .. import complexity as spec_complexity
@@ -38,42 +42,68 @@ _HIGH_RISK_KEYWORDS = [
     "security",
 ]
 
+
+def _keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    # One scan per keyword group instead of a substring search per keyword
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# In _TASK_TYPE_KEYWORDS order, which is the match precedence
+_TASK_TYPE_PATTERNS = tuple(
+    (task_type, _keyword_pattern(keywords))
+    for task_type, keywords in _TASK_TYPE_KEYWORDS.items()
+)
+_HIGH_RISK_PATTERN = _keyword_pattern(_HIGH_RISK_KEYWORDS)
+
 _IPC_MARKERS = ("ipcRenderer.invoke(", "ipcMain.handle(")
+_IPC_MARKER_BYTES = tuple(marker.encode() for marker in _IPC_MARKERS)
+_IPC_HANDLER_DIR = "apps/frontend/src/main/ipc-handlers/"
 _PROMPT_RUNTIME_PREFIXES = (
     "apps/backend/prompts/",
     "apps/backend/prompts_pkg/",
 )
-_RUNTIME_CONFIG_NAMES = {
-    "pytest.ini",
-    "pyproject.toml",
-    "package.json",
-    "dockerfile",
-}
+_RUNTIME_CONFIG_NAMES = frozenset(
+    {
+        "pytest.ini",
+        "pyproject.toml",
+        "package.json",
+        "dockerfile",
+    }
+)
 _RUNTIME_CONFIG_PREFIXES = (
     ".env",
     "vite.config.",
     "electron-builder.",
 )
 _RUNTIME_CONFIG_PATHS = (".github/workflows/",)
+_RUNTIME_CONFIG_PATH_PATTERN = _keyword_pattern(_RUNTIME_CONFIG_PATHS)
 _DOC_PREFIXES = ("new-plans/",)
 
+# Test aliases for backend files, accumulated over every matching directory
+_BACKEND_DIR_TESTS = (
+    ("apps/backend/security/", ("PYTEST_SECURITY",)),
+    ("apps/backend/spec/pipeline/", ("PYTEST_PIPELINE", "PYTEST_ROUTING")),
+    ("apps/backend/qa/", ("PYTEST_PROOF_GATE",)),
+    ("apps/backend/ipc/", ("PYTEST_PIPELINE", "NPM_TEST")),
+    ("apps/backend/agents/", ("PYTEST_PIPELINE",)),
+    ("apps/backend/prompts_pkg/", ("PYTEST_PIPELINE",)),
+)
+
+# Last archived intake_report.v<N>.md number, so archiving skips the glob
+_INTAKE_VERSION_FILE = ".intake_version"
+
 
 def load_task_intake(spec_dir: Path) -> dict | None:
-    intake_path = spec_dir / "task_intake.json"
-    if not intake_path.exists():
-        return None
     try:
-        with intake_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return data if isinstance(data, dict) else None
-    except (OSError, json.JSONDecodeError):
+        data = json_io.read_json(spec_dir / "task_intake.json")
+    except (OSError, json_io.JSONDecodeError):
         return None
+    return data if isinstance(data, dict) else None
 
 
 def write_task_intake(spec_dir: Path, intake: dict) -> Path:
     intake_path = spec_dir / "task_intake.json"
-    with intake_path.open("w", encoding="utf-8") as handle:
-        json.dump(intake, handle, indent=2)
+    json_io.write_json(intake_path, intake)
     return intake_path
 
 
@@ -82,28 +112,35 @@ def determine_pipeline(task_intake: dict) -> str:
     return "non-code" if task_type != "code" else "code"
 
 
-def _load_project_index(project_dir: Path) -> dict:
-    index_path = resolve_auto_build_dir(project_dir) / "project_index.json"
-    if not index_path.exists():
-        return {}
+def _read_json_dict(path: Path) -> dict:
+    """
+    Read a JSON object file, parsed at most once per file version.
+
+    Missing, unreadable, malformed and non-object files all read as {}.
+    Cached values are shared between calls; do not mutate.
+    """
     try:
-        with index_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return data if isinstance(data, dict) else {}
-    except (OSError, json.JSONDecodeError):
+        stat = path.stat()
+    except OSError:
         return {}
+    return _read_json_dict_version(str(path), stat.st_mtime_ns, stat.st_size)
 
 
-def _load_scope_contract(spec_dir: Path) -> dict:
-    scope_path = spec_dir / "scope_contract.json"
-    if not scope_path.exists():
-        return {}
+@lru_cache(maxsize=64)
+def _read_json_dict_version(path: str, mtime_ns: int, size: int) -> dict:
     try:
-        with scope_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return data if isinstance(data, dict) else {}
-    except (OSError, json.JSONDecodeError):
+        data = json_io.read_json(path)
+    except (OSError, json_io.JSONDecodeError):
         return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _load_project_index(project_dir: Path) -> dict:
+    return _read_json_dict(resolve_auto_build_dir(project_dir) / "project_index.json")
+
+
+def _load_scope_contract(spec_dir: Path) -> dict:
+    return _read_json_dict(spec_dir / "scope_contract.json")
 
 
 def _load_requirements_intake(requirements_data: dict | None) -> dict | None:
@@ -113,6 +150,12 @@ def _load_requirements_intake(requirements_data: dict | None) -> dict | None:
     return intake if isinstance(intake, dict) else None
 
 
+def _question_text(question: object) -> str:
+    if isinstance(question, dict):
+        return question.get("question", "").strip()
+    return str(question).strip()
+
+
 def _render_intake_report(intake: dict) -> str:
     timestamp = datetime.utcnow().isoformat() + "Z"
     lines = [
@@ -144,27 +187,37 @@ def _render_intake_report(intake: dict) -> str:
     questions = intake.get("clarifying_questions") or []
     if questions:
         lines.append("## Clarifying Questions")
-        for question in questions:
-            if isinstance(question, dict):
-                lines.append(f"- {question.get('question', '').strip()}")
-            else:
-                lines.append(f"- {str(question).strip()}")
+        lines.extend([f"- {_question_text(question)}" for question in questions])
         lines.append("")
     return "\n".join(lines).strip() + "\n"
 
 
+def _latest_intake_report_version(spec_dir: Path) -> int:
+    versions = []
+    for candidate in spec_dir.glob("intake_report.v*.md"):
+        try:
+            suffix = candidate.stem.split(".v")[-1]
+            versions.append(int(suffix))
+        except (ValueError, IndexError):
+            continue
+    return max(versions, default=0)
+
+
+def _next_intake_report_version(spec_dir: Path) -> int:
+    version_file = spec_dir / _INTAKE_VERSION_FILE
+    try:
+        current = int(version_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        # No counter yet (spec folders from before it existed): scan once
+        current = _latest_intake_report_version(spec_dir)
+    version_file.write_text(str(current + 1), encoding="utf-8")
+    return current + 1
+
+
 def _write_versioned_intake_report(spec_dir: Path, intake: dict) -> None:
     report_path = spec_dir / "intake_report.md"
     if report_path.exists():
-        existing = list(spec_dir.glob("intake_report.v*.md"))
-        versions = []
-        for candidate in existing:
-            try:
-                suffix = candidate.stem.split(".v")[-1]
-                versions.append(int(suffix))
-            except (ValueError, IndexError):
-                continue
-        next_version = max(versions, default=0) + 1
+        next_version = _next_intake_report_version(spec_dir)
         report_path.rename(spec_dir / f"intake_report.v{next_version}.md")
     report_path.write_text(_render_intake_report(intake), encoding="utf-8")
 
@@ -179,15 +232,14 @@ def _infer_task_type(task_description: str, workflow_type: str | None) -> str:
         return "plan"
 
     description = task_description.lower()
-    for task_type, keywords in _TASK_TYPE_KEYWORDS.items():
-        if any(keyword in description for keyword in keywords):
+    for task_type, pattern in _TASK_TYPE_PATTERNS:
+        if pattern.search(description):
             return task_type
     return "code"
 
 
 def _infer_risk(task_description: str) -> str:
-    description = task_description.lower()
-    if any(keyword in description for keyword in _HIGH_RISK_KEYWORDS):
+    if _HIGH_RISK_PATTERN.search(task_description.lower()):
         return "high"
     return "low"
 
@@ -216,59 +268,71 @@ def _is_concrete_file(path: str) -> bool:
     return True
 
 
-def _is_prompt_runtime(normalized: str) -> bool:
-    return normalized.startswith(_PROMPT_RUNTIME_PREFIXES)
+def _is_prompt_runtime(path_lower: str) -> bool:
+    return path_lower.startswith(_PROMPT_RUNTIME_PREFIXES)
 
 
-def _is_doc_file(normalized: str) -> bool:
-    name = Path(normalized).name
-    if normalized.startswith(_DOC_PREFIXES):
+def _is_doc_file(path_lower: str, name_lower: str) -> bool:
+    if path_lower.startswith(_DOC_PREFIXES):
         return True
-    if name.startswith("CODEX-") and name.lower().endswith(".md"):
+    if name_lower.startswith("codex-") and name_lower.endswith(".md"):
         return True
-    if normalized.lower().endswith(".md") and not _is_prompt_runtime(normalized):
+    if path_lower.endswith(".md") and not _is_prompt_runtime(path_lower):
         return True
     return False
 
 
-def _is_runtime_config(normalized: str) -> bool:
-    name = Path(normalized).name
-    if name.lower() in _RUNTIME_CONFIG_NAMES:
+def _is_runtime_config(path_lower: str, name_lower: str) -> bool:
+    if name_lower in _RUNTIME_CONFIG_NAMES:
         return True
-    if any(name.startswith(prefix) for prefix in _RUNTIME_CONFIG_PREFIXES):
+    if name_lower.startswith(_RUNTIME_CONFIG_PREFIXES):
         return True
-    if any(segment in normalized for segment in _RUNTIME_CONFIG_PATHS):
+    if _RUNTIME_CONFIG_PATH_PATTERN.search(path_lower):
         return True
     return False
 
 
+def _in_ipc_handler_dir(file_path: str) -> bool:
+    return _IPC_HANDLER_DIR in _normalize_path(file_path)
+
+
 def _file_has_ipc_marker(project_dir: Path, file_path: str) -> bool:
-    normalized = _normalize_path(file_path)
-    if "apps/frontend/src/main/ipc-handlers/" in normalized:
+    if _in_ipc_handler_dir(file_path):
         return True
+    target = project_dir / _normalize_path(file_path)
+    try:
+        stat = target.stat()
+    except OSError:
+        return False
+    if not S_ISREG(stat.st_mode):
+        return False
+    return _scan_ipc_markers(str(target), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=2048)
+def _scan_ipc_markers(path: str, mtime_ns: int, size: int) -> bool:
+    # Markers are ASCII, so search the raw bytes rather than decoding the file
     try:
-        target = project_dir / normalized
-        if not target.exists() or not target.is_file():
-            return False
-        content = target.read_text(encoding="utf-8", errors="ignore")
+        with open(path, "rb") as handle:
+            content = handle.read()
     except OSError:
         return False
-    return any(marker in content for marker in _IPC_MARKERS)
+    return any(marker in content for marker in _IPC_MARKER_BYTES)
 
 
 def _get_tests_for_file(
     project_dir: Path, file_path: str, *, has_ipc_change: bool
 ) -> list[str]:
-    normalized = _normalize_path(file_path)
-    normalized_lower = normalized.lower()
+    normalized_lower = _normalize_path(file_path).lower()
+    name_lower = normalized_lower.rsplit("/", 1)[-1]
 
     if _is_prompt_runtime(normalized_lower):
         return ["PYTEST_PIPELINE", "PYTEST_PROMPTS"]
 
-    if _is_doc_file(normalized_lower):
+    if _is_doc_file(normalized_lower, name_lower):
         return []
 
-    if _is_runtime_config(normalized_lower):
+    if _is_runtime_config(normalized_lower, name_lower):
         smoke_script = project_dir / "scripts" / "smoke-build.sh"
         if "dockerfile" in normalized_lower or ".github/workflows/" in normalized_lower:
             if smoke_script.exists():
@@ -276,22 +340,13 @@ def _get_tests_for_file(
         return ["PYTEST_COLLECT"]
 
     if normalized_lower.startswith("apps/backend/"):
-        matches = []
-        if "apps/backend/security/" in normalized_lower:
-            matches.append("PYTEST_SECURITY")
-        if "apps/backend/spec/pipeline/" in normalized_lower:
-            matches.extend(["PYTEST_PIPELINE", "PYTEST_ROUTING"])
-        if "apps/backend/qa/" in normalized_lower:
-            matches.append("PYTEST_PROOF_GATE")
-        if "apps/backend/ipc/" in normalized_lower:
-            matches.extend(["PYTEST_PIPELINE", "NPM_TEST"])
-        if "apps/backend/agents/" in normalized_lower:
-            matches.append("PYTEST_PIPELINE")
-        if "apps/backend/prompts_pkg/" in normalized_lower:
-            matches.append("PYTEST_PIPELINE")
-        if matches:
-            return matches
-        return ["PYTEST_PIPELINE"]
+        matches = [
+            alias
+            for segment, aliases in _BACKEND_DIR_TESTS
+            if segment in normalized_lower
+            for alias in aliases
+        ]
+        return matches or ["PYTEST_PIPELINE"]
 
     if normalized_lower.startswith("apps/frontend/"):
         tests = ["NPM_TEST"]
@@ -360,9 +415,12 @@ def _determine_tests_to_run(
 
     tests: list[str] = []
     tests_seen: set[str] = set()
-    has_ipc_change = any(
-        _file_has_ipc_marker(project_dir, path) for path in files_to_modify
-    )
+    # A path in the handler dir settles it before any file is read
+    has_ipc_change = any(_in_ipc_handler_dir(path) for path in files_to_modify)
+    if not has_ipc_change:
+        has_ipc_change = any(
+            _file_has_ipc_marker(project_dir, path) for path in files_to_modify
+        )
 
     for file_path in files_to_modify:
         for alias in _get_tests_for_file(
@@ -496,8 +554,8 @@ def run_preflight_scoper(
         input_files = []
 
     output_files = scope_contract.get("candidate_files")
-    if not isinstance(output_files, list):
-        output_files = []
+    # Copied: the contract is a shared cached value and the intake escapes
+    output_files = list(output_files) if isinstance(output_files, list) else []
 
     files_to_modify, files_source, files_inferred = _resolve_files_to_modify(
         task_type, requirements_data, scope_contract, clarifying_questions
@@ -18,6 +18,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from core import json_io
+
 
 REPORT_FILENAME = "post_code_tests.json"
 DEFAULT_TIMEOUT_SEC = 1200.0
@@ -74,11 +76,9 @@ _PRIORITY_RANK = {cmd: index for index, cmd in enumerate(_PRIORITY_COMMANDS)}
 
 
 def _load_json(path: Path) -> dict | None:
-    if not path.exists():
-        return None
     try:
-        return json.loads(path.read_text())
-    except json.JSONDecodeError:
+        return json_io.read_json(path)
+    except (FileNotFoundError, json_io.JSONDecodeError):
         return None
 
 
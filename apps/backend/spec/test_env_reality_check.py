@@ -1,5 +1,8 @@
 import asyncio
+import os
+from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -110,3 +113,154 @@ def test_phase_env_reality_check_writes_report(tmp_path, monkeypatch):
 
     assert result.success is True
     assert (spec_dir / "env_reality_check.json").exists()
+
+
+def test_env_reality_check_caches_path_lookups(tmp_path, monkeypatch):
+    project_dir = tmp_path / "project"
+    spec_dir = tmp_path / "specs"
+    project_dir.mkdir()
+    spec_dir.mkdir()
+
+    probed: list[str] = []
+
+    def fake_is_executable_file(path):
+        probed.append(Path(path).name)
+        return False
+
+    monkeypatch.setattr(env_reality_check, "_which_cache", {})
+    monkeypatch.setattr(
+        env_reality_check, "_is_executable_file", fake_is_executable_file
+    )
+    for _ in range(2):
+        env_reality_check.run_env_reality_check(
+            project_dir=project_dir,
+            spec_dir=spec_dir,
+            project_index={},
+            env={"PATH": "/nonexistent"},
+        )
+
+    assert sorted(probed) == ["git", "iflow"]
+
+
+def test_which_many_resolves_first_match_on_path(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    for directory, name in ((first, "node"), (second, "node"), (second, "git")):
+        binary = directory / name
+        binary.write_text("#!/bin/sh\n")
+        binary.chmod(0o755)
+
+    monkeypatch.setattr(env_reality_check, "_which_cache", {})
+    path_env = os.pathsep.join([str(first), str(second)])
+    resolved = env_reality_check._which_many(["git", "node", "npm"], path_env)
+
+    assert resolved == {
+        "git": str(second / "git"),
+        "node": str(first / "node"),
+        "npm": None,
+    }
+
+
+def test_which_many_rechecks_missing_binary_after_ttl(tmp_path, monkeypatch):
+    clock = [1_000.0]
+    monkeypatch.setattr(
+        env_reality_check, "time", SimpleNamespace(monotonic=lambda: clock[0])
+    )
+    monkeypatch.setattr(env_reality_check, "_which_cache", {})
+    path_env = str(tmp_path)
+
+    assert env_reality_check._which_many(["git"], path_env) == {"git": None}
+
+    binary = tmp_path / "git"
+    binary.write_text("#!/bin/sh\n")
+    binary.chmod(0o755)
+    # Still memoized within the TTL
+    clock[0] += 1
+    assert env_reality_check._which_many(["git"], path_env) == {"git": None}
+
+    clock[0] += env_reality_check._REPORT_CACHE_TTL_SECONDS
+    assert env_reality_check._which_many(["git"], path_env) == {"git": str(binary)}
+
+
+def test_env_reality_check_missing_project_skips_binary_checks(tmp_path, monkeypatch):
+    spec_dir = tmp_path / "specs"
+    spec_dir.mkdir()
+
+    def fail_which_many(*_args, **_kwargs):
+        raise AssertionError("PATH lookups should be skipped")
+
+    monkeypatch.setattr(env_reality_check, "_which_many", fail_which_many)
+    result = env_reality_check.run_env_reality_check(
+        project_dir=tmp_path / "missing-project",
+        spec_dir=spec_dir,
+        project_index={},
+        env={"PATH": ""},
+    )
+
+    assert result["status"] == "failed"
+    assert result["errors"] == ["project_dir does not exist"]
+    assert "binaries" not in result["checks"]
+
+
+def test_env_reality_check_reuses_recent_report(tmp_path, monkeypatch):
+    project_dir = tmp_path / "project"
+    spec_dir = tmp_path / "specs"
+    project_dir.mkdir()
+    spec_dir.mkdir()
+
+    runs: list[str | None] = []
+    real_run_checks = env_reality_check._run_checks
+
+    def counting_run_checks(project_dir, spec_dir, languages, requirements, env):
+        runs.append(env.get("PATH"))
+        return real_run_checks(project_dir, spec_dir, languages, requirements, env)
+
+    monkeypatch.setattr(env_reality_check, "_run_checks", counting_run_checks)
+    env_reality_check.reset_report_cache()
+
+    first = env_reality_check.run_env_reality_check(
+        project_dir=project_dir, spec_dir=spec_dir, env={"PATH": ""}
+    )
+    first["errors"].append("mutated by caller")
+    second = env_reality_check.run_env_reality_check(
+        project_dir=project_dir, spec_dir=spec_dir, env={"PATH": ""}
+    )
+    env_reality_check.run_env_reality_check(
+        project_dir=project_dir, spec_dir=spec_dir, env={"PATH": str(tmp_path)}
+    )
+    env_reality_check.reset_report_cache()
+
+    assert runs == ["", str(tmp_path)]
+    assert "mutated by caller" not in second["errors"]
+
+
+def test_env_reality_check_cached_report_gets_fresh_created_at(tmp_path, monkeypatch):
+    project_dir = tmp_path / "project"
+    spec_dir = tmp_path / "specs"
+    project_dir.mkdir()
+    spec_dir.mkdir()
+
+    stamps = iter([datetime(2026, 1, 1, 12, 0, 0), datetime(2026, 1, 1, 12, 0, 20)])
+
+    class FakeDatetime:
+        @staticmethod
+        def now():
+            return next(stamps)
+
+    monkeypatch.setattr(env_reality_check, "datetime", FakeDatetime)
+    env_reality_check.reset_report_cache()
+
+    first = env_reality_check.run_env_reality_check(
+        project_dir=project_dir, spec_dir=spec_dir, env={"PATH": ""}
+    )
+    second = env_reality_check.run_env_reality_check(
+        project_dir=project_dir, spec_dir=spec_dir, env={"PATH": ""}
+    )
+    env_reality_check.reset_report_cache()
+
+    assert first["created_at"] == "2026-01-01T12:00:00"
+    assert second["created_at"] == "2026-01-01T12:00:20"
+    assert second["checks"] == first["checks"]
+    assert second["status"] == first["status"]
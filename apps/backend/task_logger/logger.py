@@ -271,6 +271,61 @@ class TaskLogger:
         if print_to_console:
             print(content, flush=True)
 
+    def log_many(
+        self,
+        contents: list[str],
+        entry_type: LogEntryType = LogEntryType.TEXT,
+        phase: LogPhase | None = None,
+        print_to_console: bool = True,
+    ) -> None:
+        """
+        Log several messages, writing the log file once for the whole batch.
+
+        Each message still becomes its own entry and streaming marker, exactly
+        as if log() had been called for it.
+
+        Args:
+            contents: The messages to log, in order
+            entry_type: Type of entry (text, error, success, info)
+            phase: Optional phase override (uses current_phase if not specified)
+            print_to_console: Whether to also print to stdout (default True)
+        """
+        if not contents:
+            return
+        phase_key = (phase or self.current_phase or LogPhase.CODING).value
+        timestamp = self._timestamp()
+
+        self.storage.add_entries(
+            [
+                LogEntry(
+                    timestamp=timestamp,
+                    type=entry_type.value,
+                    content=content,
+                    phase=phase_key,
+                    subtask_id=self.current_subtask,
+                    session=self.current_session,
+                )
+                for content in contents
+            ]
+        )
+
+        for content in contents:
+            self._emit(
+                "TEXT",
+                {
+                    "content": content,
+                    "phase": phase_key,
+                    "type": entry_type.value,
+                    "subtask_id": self.current_subtask,
+                    "timestamp": timestamp,
+                },
+            )
+            self._debug_log(
+                content, entry_type, phase_key, subtask=self.current_subtask
+            )
+            if print_to_console:
+                print(content, flush=True)
+
     def log_error(self, content: str, phase: LogPhase | None = None) -> None:
         """Log an error message."""
         self.log(content, LogEntryType.ERROR, phase)
@@ -100,6 +100,21 @@ class LogStorage:
         Args:
             entry: The log entry to add
         """
+        self._append_entry(entry)
+        self.save()
+
+    def add_entries(self, entries: list[LogEntry]) -> None:
+        """
+        Add several entries and save the log file once.
+
+        Args:
+            entries: The log entries to add, in order
+        """
+        for entry in entries:
+            self._append_entry(entry)
+        self.save()
+
+    def _append_entry(self, entry: LogEntry) -> None:
         phase_key = entry.phase
         if phase_key not in self._data["phases"]:
             # Create phase if it doesn't exist
@@ -112,7 +127,6 @@ class LogStorage:
             }
 
         self._data["phases"][phase_key]["entries"].append(entry.to_dict())
-        self.save()
 
     def update_phase_status(
         self, phase: str, status: str, completed_at: str | None = None
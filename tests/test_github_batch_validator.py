@@ -0,0 +1,209 @@
+"""
+Tests for Batch Validation Agent
+================================
+
+Tests the BatchValidator session handling and the trivial-batch pre-pass.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+import batch_validator
+from batch_validator import (
+    TRIVIAL_CONFIDENCE,
+    TRIVIAL_PRIMARY_SIMILARITY,
+    BatchValidator,
+)
+
+LLM_VERDICT = {
+    "is_valid": False,
+    "confidence": 0.7,
+    "reasoning": "Different root causes",
+    "suggested_splits": [[1], [2]],
+    "common_theme": "mixed",
+}
+
+
+class TextBlock:
+    def __init__(self, text):
+        self.text = text
+
+
+class AssistantMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeSession:
+    """Stand-in for the compat client; records what each session saw."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.prompts = []
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+        return False
+
+    async def query(self, prompt):
+        self.prompts.append(prompt)
+        if self.fail:
+            raise RuntimeError("connection dropped")
+
+    async def receive_response(self):
+        yield AssistantMessage([TextBlock(json.dumps(LLM_VERDICT))])
+
+
+@pytest.fixture
+def validator(tmp_path):
+    """A validator whose LLM path is enabled and backed by FakeSessions."""
+    sessions = []
+    failures = []
+
+    def create_client():
+        session = FakeSession(fail=bool(failures and failures.pop(0)))
+        sessions.append(session)
+        return session
+
+    with patch.object(batch_validator, "IFLOW_SDK_AVAILABLE", True), patch.object(
+        batch_validator, "has_iflow_auth", return_value=True
+    ):
+        instance = BatchValidator(project_dir=tmp_path)
+        instance._create_client = create_client
+        instance.sessions = sessions
+        instance.failures = failures
+        yield instance
+
+
+def _issue(number, title, similarity=1.0, labels=()):
+    return {
+        "issue_number": number,
+        "title": title,
+        "body": "",
+        "labels": list(labels),
+        "similarity_to_primary": similarity,
+    }
+
+
+def _validate(validator, issues, batch_id="b1"):
+    return asyncio.run(
+        validator.validate_batch(
+            batch_id=batch_id,
+            primary_issue=issues[0]["issue_number"],
+            issues=issues,
+            themes=["theme"],
+        )
+    )
+
+
+class TestSessions:
+    """Each batch is validated in its own iFlow session."""
+
+    def test_each_batch_gets_fresh_session(self, validator):
+        issues_a = [_issue(1, "crash on save"), _issue(2, "login button misaligned")]
+        issues_b = [_issue(3, "slow startup"), _issue(4, "typo in footer")]
+
+        _validate(validator, issues_a, "a")
+        _validate(validator, issues_b, "b")
+
+        assert len(validator.sessions) == 2
+        first, second = validator.sessions
+        # The second batch's session never saw the first batch's prompt
+        assert len(first.prompts) == 1 and "Batch ID: a" in first.prompts[0]
+        assert len(second.prompts) == 1 and "Batch ID: b" in second.prompts[0]
+        assert "crash on save" not in second.prompts[0]
+        assert first.closed and second.closed
+
+    def test_failed_query_closes_session_and_next_batch_reconnects(self, validator):
+        validator.failures.append(True)
+        issues = [_issue(1, "crash on save"), _issue(2, "login button misaligned")]
+
+        failed = _validate(validator, issues, "a")
+        retried = _validate(validator, issues, "b")
+
+        assert failed.is_valid is True
+        assert failed.confidence == 0.5
+        assert "connection dropped" in failed.reasoning
+        assert validator.sessions[0].closed
+        assert len(validator.sessions) == 2
+        assert retried.is_valid is False
+        assert retried.suggested_splits == [[1], [2]]
+
+
+class TestTrivialBatches:
+    """The pre-pass only skips the model for near-identical batches."""
+
+    def test_single_issue_batch_skips_model(self, validator):
+        result = _validate(validator, [_issue(1, "crash on save")])
+
+        assert result.is_valid is True
+        assert result.confidence == 1.0
+        assert validator.sessions == []
+
+    def test_similarity_at_threshold_skips_model(self, validator):
+        # 8 shared tokens out of 10: Jaccard exactly TRIVIAL_TITLE_SIMILARITY
+        issues = [
+            _issue(1, "a b c d e f g h"),
+            _issue(2, "a b c d e f g h i j", similarity=TRIVIAL_PRIMARY_SIMILARITY),
+        ]
+
+        result = _validate(validator, issues)
+
+        assert result.is_valid is True
+        assert result.confidence == TRIVIAL_CONFIDENCE
+        assert validator.sessions == []
+
+    def test_titles_just_below_threshold_go_to_model(self, validator):
+        # 7 shared tokens out of 9: Jaccard 0.78
+        issues = [_issue(1, "a b c d e f g"), _issue(2, "a b c d e f g h i")]
+
+        result = _validate(validator, issues)
+
+        assert result.is_valid is False
+        assert len(validator.sessions) == 1
+
+    def test_primary_similarity_just_below_threshold_goes_to_model(self, validator):
+        issues = [
+            _issue(1, "crash on save"),
+            _issue(2, "crash on save", similarity=TRIVIAL_PRIMARY_SIMILARITY - 0.01),
+        ]
+
+        result = _validate(validator, issues)
+
+        assert result.is_valid is False
+        assert len(validator.sessions) == 1
+
+    def test_labels_count_toward_similarity(self, validator):
+        # Same title, but disjoint labels pull Jaccard to 3/7
+        issues = [
+            _issue(1, "crash on save", labels=["bug", "editor"]),
+            _issue(2, "crash on save", labels=["ui", "docs"]),
+        ]
+
+        _validate(validator, issues)
+
+        assert len(validator.sessions) == 1
+
+    def test_skip_trivial_disabled_forces_model(self, validator):
+        validator.skip_trivial = False
+        issues = [_issue(1, "crash on save"), _issue(2, "crash on save")]
+
+        result = _validate(validator, issues)
+
+        assert result.is_valid is False
+        assert len(validator.sessions) == 1
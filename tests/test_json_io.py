@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for JSON File Helpers
+===========================
+
+Tests the core/json_io.py module including:
+- Round-tripping through write_json/read_json
+- Standard library fallback when orjson is unavailable
+- Decode errors surfacing as json.JSONDecodeError
+"""
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core import json_io
+
+
+@pytest.fixture(params=[True, False], ids=["default", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with the default backend and the stdlib fallback."""
+    if not request.param:
+        monkeypatch.setattr(json_io, "_HAS_ORJSON", False)
+    return request.param
+
+
+def test_round_trip(tmp_path: Path, backend):
+    payload = {"status": "passed", "errors": [], "checks": {"count": 3, "name": "é"}}
+    target = tmp_path / "report.json"
+
+    json_io.write_json(target, payload)
+
+    assert json_io.read_json(target) == payload
+    assert json.loads(target.read_text(encoding="utf-8")) == payload
+    assert target.read_text(encoding="utf-8").startswith('{\n  "status"')
+
+
+def test_invalid_json_raises_stdlib_error(tmp_path: Path, backend):
+    target = tmp_path / "broken.json"
+    target.write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        json_io.read_json(target)
+
+
+def test_write_replaces_atomically(tmp_path: Path, monkeypatch):
+    target = tmp_path / "scope_contract.json"
+    json_io.write_json(target, {"version": 1})
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json_io.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        json_io.write_json(target, {"version": 2})
+
+    # The previous report survives and no temp files are left behind
+    assert json_io.read_json(target) == {"version": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["scope_contract.json"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_write_respects_umask(tmp_path: Path):
+    target = tmp_path / "requirements.json"
+    reference = tmp_path / "reference.json"
+
+    json_io.write_json(target, {"task": "x"})
+    reference.write_text("{}", encoding="utf-8")
+
+    mode = stat.S_IMODE(os.stat(target).st_mode)
+    assert mode == stat.S_IMODE(os.stat(reference).st_mode)
+    assert mode == 0o666 & ~json_io._UMASK
@@ -31,3 +31,88 @@ def test_preflight_scoper_runtime_bridge(tmp_path: Path) -> None:
     assert (spec_dir / 'task_intake.json').exists()
     assert (spec_dir / 'intake_report.md').exists()
     assert (spec_dir / 'intake_report.v1.md').exists()
+
+
+def test_scope_contract_parsed_once_per_version(tmp_path: Path, monkeypatch) -> None:
+    from apps.backend.spec.pipeline import preflight_scoper
+
+    scope_file = tmp_path / 'scope_contract.json'
+    scope_file.write_text(json.dumps({'candidate_files': ['a.py']}))
+    reads = []
+    real_read = preflight_scoper.json_io.read_json
+    monkeypatch.setattr(
+        preflight_scoper.json_io,
+        'read_json',
+        lambda path: reads.append(path) or real_read(path),
+    )
+
+    first = preflight_scoper._load_scope_contract(tmp_path)
+    assert preflight_scoper._load_scope_contract(tmp_path) is first
+    assert len(reads) == 1
+
+    scope_file.write_text(json.dumps({'candidate_files': ['a.py', 'b.py']}))
+    assert preflight_scoper._load_scope_contract(tmp_path) == {
+        'candidate_files': ['a.py', 'b.py']
+    }
+    assert len(reads) == 2
+
+
+def test_keyword_inference_precedence() -> None:
+    from apps.backend.spec.pipeline.preflight_scoper import _infer_risk, _infer_task_type
+
+    # analysis is checked before plan and content
+    assert _infer_task_type('Write a plan to Investigate the crash', None) == 'analysis'
+    assert _infer_task_type('Update the README', None) == 'content'
+    assert _infer_task_type('Add a button', None) == 'code'
+    assert _infer_task_type('Investigate', 'docs') == 'content'
+    assert _infer_risk('Rotate OAuth tokens') == 'high'
+    assert _infer_risk('Rename a variable') == 'low'
+
+
+def test_ipc_marker_scan_cached_per_version(tmp_path: Path, monkeypatch) -> None:
+    from apps.backend.spec.pipeline import preflight_scoper
+
+    source = tmp_path / 'apps' / 'frontend' / 'src' / 'api.ts'
+    source.parent.mkdir(parents=True)
+    source.write_text("window.ipcRenderer.invoke('x')")
+    scans = []
+    real_scan = preflight_scoper._scan_ipc_markers.__wrapped__
+    monkeypatch.setattr(
+        preflight_scoper,
+        '_scan_ipc_markers',
+        preflight_scoper.lru_cache()(lambda *key: scans.append(key) or real_scan(*key)),
+    )
+
+    path = 'apps/frontend/src/api.ts'
+    assert preflight_scoper._file_has_ipc_marker(tmp_path, path)
+    assert preflight_scoper._file_has_ipc_marker(tmp_path, path)
+    assert len(scans) == 1
+
+    source.write_text('export const api = {}')
+    assert not preflight_scoper._file_has_ipc_marker(tmp_path, path)
+    assert len(scans) == 2
+
+    # A handler-dir path short-circuits before any file is read
+    tests = preflight_scoper._determine_tests_to_run(
+        'code',
+        [path, 'apps/frontend/src/main/ipc-handlers/a.ts'],
+        tmp_path,
+        [],
+    )
+    assert 'PYTEST_PIPELINE' in tests
+    assert len(scans) == 2
+
+
+def test_intake_report_versions_use_counter(tmp_path: Path) -> None:
+    from apps.backend.spec.pipeline import preflight_scoper
+
+    # Folder from before the counter existed: numbering resumes after the scan
+    (tmp_path / 'intake_report.md').write_text('current')
+    (tmp_path / 'intake_report.v3.md').write_text('old')
+
+    preflight_scoper._write_versioned_intake_report(tmp_path, {})
+    assert (tmp_path / 'intake_report.v4.md').read_text() == 'current'
+
+    preflight_scoper._write_versioned_intake_report(tmp_path, {})
+    assert (tmp_path / 'intake_report.v5.md').exists()
+    assert (tmp_path / preflight_scoper._INTAKE_VERSION_FILE).read_text() == '5'
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for Project Context Detection
+===================================
+
+Tests prompts_pkg/project_context.py index freshness checks.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from prompts_pkg import project_context
+from prompts_pkg.project_context import should_refresh_project_index
+
+
+@pytest.fixture(autouse=True)
+def _clear_refresh_cache(monkeypatch):
+    # Other test modules mock `init` while project_context is first imported;
+    # bind the real helper at test time, when conftest has restored `init`
+    import init
+
+    monkeypatch.setattr(
+        project_context, "resolve_auto_build_dir", init.resolve_auto_build_dir
+    )
+    project_context._REFRESH_CACHE.clear()
+    yield
+    project_context._REFRESH_CACHE.clear()
+
+
+def _write_index(project_dir: Path, mtime: int) -> Path:
+    index_file = (
+        project_context.resolve_auto_build_dir(project_dir) / "project_index.json"
+    )
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    index_file.write_text("{}")
+    os.utime(index_file, (mtime, mtime))
+    return index_file
+
+
+def _touch(path: Path, mtime: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}")
+    os.utime(path, (mtime, mtime))
+
+
+def test_missing_index_needs_refresh(tmp_path):
+    assert should_refresh_project_index(tmp_path) is True
+
+
+@pytest.mark.parametrize(
+    "dep_file, expected",
+    [
+        ("package.json", True),
+        ("go.mod", True),
+        ("api/pyproject.toml", True),
+        ("node_modules/pkg/package.json", False),
+        (".hidden/package.json", False),
+        ("api/src/package.json", False),
+        ("README.md", False),
+    ],
+)
+def test_newer_dependency_file_triggers_refresh(tmp_path, dep_file, expected):
+    _write_index(tmp_path, 1_000)
+    _touch(tmp_path / dep_file, 2_000)
+
+    assert should_refresh_project_index(tmp_path) is expected
+
+
+def test_older_dependency_files_keep_index(tmp_path):
+    _touch(tmp_path / "package.json", 1_000)
+    _touch(tmp_path / "web" / "package.json", 1_000)
+    _write_index(tmp_path, 2_000)
+
+    assert should_refresh_project_index(tmp_path) is False
+
+
+def test_refresh_decision_cached_per_index_mtime(tmp_path):
+    _write_index(tmp_path, 2_000)
+    assert should_refresh_project_index(tmp_path) is False
+
+    # Within the TTL the dependency scan is skipped
+    _touch(tmp_path / "package.json", 3_000)
+    assert should_refresh_project_index(tmp_path) is False
+
+    # A rewritten index changes the key and is checked again
+    _write_index(tmp_path, 2_500)
+    assert should_refresh_project_index(tmp_path) is True
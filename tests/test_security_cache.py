@@ -7,7 +7,11 @@ from pathlib import Path
 # Ensure local apps/backend is in path
 sys.path.insert(0, str(Path(__file__).parents[1] / "apps" / "backend"))
 
-from security.profile import get_security_profile, reset_profile_cache
+from security.profile import (
+    get_command_checker,
+    get_security_profile,
+    reset_profile_cache,
+)
 from security.constants import PROFILE_FILENAME
 from project.models import SecurityProfile
 from project.analyzer import ProjectAnalyzer
@@ -115,3 +119,22 @@ def test_cache_invalidation_on_file_deletion(mock_project_dir, mock_profile_path
     # 4. Call again - should handle deletion gracefully and fallback to fresh analysis
     profile2 = get_security_profile(mock_project_dir)
     assert "unique_cmd_A" not in profile2.get_all_allowed_commands() 
+
+
+def test_command_checker_reused_until_profile_changes():
+    reset_profile_cache()
+
+    profile = SecurityProfile()
+    profile.base_commands = {"ls", "rm"}
+
+    checker = get_command_checker(profile)
+    assert get_command_checker(profile) is checker
+    assert checker("ls", lambda cmd: cmd) == (True, "")
+    assert checker("curl", lambda cmd: cmd)[0] is False
+    # Sensitive commands still go through their validator
+    assert checker("rm", lambda cmd: "rm -rf /")[0] is False
+
+    other = SecurityProfile()
+    other.base_commands = {"curl"}
+    assert get_command_checker(other) is not checker
+    assert get_command_checker(other)("curl", lambda cmd: cmd) == (True, "")
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Tests for Spec Agent Runner
+===========================
+
+Tests the spec/pipeline/agent_runner.py streaming loop covering:
+- Text accumulation across assistant blocks and raw chunks
+- Tool start/end pairing for ToolUse/ToolResult and ToolCall messages
+- Stopping at TaskFinishMessage
+- Aborting when the stream goes idle
+"""
+
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from spec.pipeline import agent_runner
+from spec.pipeline.agent_runner import AgentRunner
+
+
+# Stand-ins for SDK message types; the runner dispatches on class name
+class TextBlock:
+    def __init__(self, text):
+        self.text = text
+
+
+class ToolUseBlock:
+    def __init__(self, name, input, id=None):
+        self.name = name
+        self.input = input
+        self.id = id
+
+
+class ToolResultBlock:
+    def __init__(self, content, is_error=False, tool_use_id=None):
+        self.content = content
+        self.is_error = is_error
+        self.tool_use_id = tool_use_id
+
+
+class AssistantMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class UserMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class ToolCallMessage:
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+class TaskFinishMessage:
+    stop_reason = "end_turn"
+
+
+class _FakeClient:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def run_stream(monkeypatch, tmp_path: Path):
+    """Run AgentRunner.run_agent over a scripted message stream."""
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    (prompts_dir / "test_prompt.md").write_text("Do the thing")
+
+    def _run(messages, task_logger=None, delay=0.0, **kwargs):
+        async def fake_iter(client):
+            for msg in messages:
+                if delay:
+                    await asyncio.sleep(delay)
+                yield msg
+
+        async def fake_send(client, prompt):
+            return None
+
+        monkeypatch.setattr(agent_runner, "create_iflow_client", lambda *a, **k: _FakeClient())
+        monkeypatch.setattr(agent_runner, "iter_agent_messages", fake_iter)
+        monkeypatch.setattr(agent_runner, "send_agent_message", fake_send)
+        runner = AgentRunner(tmp_path, tmp_path, "test-model", task_logger)
+        return asyncio.run(
+            runner.run_agent(str(prompts_dir / "test_prompt.md"), **kwargs)
+        )
+
+    return _run
+
+
+def test_collects_text_and_stops_at_finish(run_stream):
+    messages = [
+        AssistantMessage([TextBlock("Hello "), TextBlock("world")]),
+        AssistantMessage("!"),
+        TaskFinishMessage(),
+        AssistantMessage([TextBlock("ignored")]),
+    ]
+
+    success, response = run_stream(messages)
+
+    assert success is True
+    assert response == "Hello world!"
+
+
+def test_response_streamed_to_sink(run_stream, tmp_path):
+    sink = tmp_path / "response.md"
+    messages = [
+        AssistantMessage([TextBlock("Hello "), TextBlock("world")]),
+        AssistantMessage("!"),
+    ]
+
+    success, response = run_stream(messages, response_sink=sink)
+
+    assert success is True
+    assert response == str(sink)
+    assert sink.read_text(encoding="utf-8") == "Hello world!"
+
+
+def test_pairs_tool_start_and_end(run_stream):
+    task_logger = MagicMock()
+    messages = [
+        AssistantMessage([ToolUseBlock("Read", {"file_path": "src/app.py"})]),
+        UserMessage([ToolResultBlock("file body")]),
+        ToolCallMessage(
+            tool_name="Bash", args={"command": "ls"}, output="boom", status="failed"
+        ),
+    ]
+
+    success, _ = run_stream(messages, task_logger)
+
+    assert success is True
+    started = [call.args[:2] for call in task_logger.tool_start.call_args_list]
+    assert started == [("Read", "src/app.py"), ("Bash", "ls")]
+    ended = [
+        (call.args[0], call.kwargs["success"], call.kwargs["detail"])
+        for call in task_logger.tool_end.call_args_list
+    ]
+    assert ended == [("Read", True, "file body"), ("Bash", False, "boom")]
+
+
+def test_pairs_interleaved_tool_results_by_id(run_stream):
+    task_logger = MagicMock()
+    messages = [
+        AssistantMessage(
+            [
+                ToolUseBlock("Read", {"file_path": "a.py"}, id="t1"),
+                ToolUseBlock("Grep", {"pattern": "x"}, id="t2"),
+            ]
+        ),
+        ToolCallMessage(tool_name="Bash", args={"command": "ls"}, id="t3"),
+        UserMessage(
+            [
+                ToolResultBlock("grep hits", tool_use_id="t2"),
+                ToolResultBlock("file body"),
+                ToolResultBlock("ls out", is_error=True, tool_use_id="t3"),
+            ]
+        ),
+    ]
+
+    run_stream(messages, task_logger)
+
+    ended = [
+        (call.args[0], call.kwargs["success"], call.kwargs["detail"])
+        for call in task_logger.tool_end.call_args_list
+    ]
+    assert ended == [
+        ("Grep", True, "grep hits"),
+        ("Read", True, "file body"),
+        ("Bash", False, "ls out"),
+    ]
+
+
+def test_streamed_text_logged_in_batches(run_stream):
+    task_logger = MagicMock()
+    messages = [
+        AssistantMessage([TextBlock(f"chunk {i} ") for i in range(40)]),
+        AssistantMessage([ToolUseBlock("Grep", {"pattern": "TODO"})]),
+        AssistantMessage([TextBlock("tail")]),
+    ]
+
+    run_stream(messages, task_logger)
+
+    assert task_logger.log.call_count == 0
+    batches = [call.args[0] for call in task_logger.log_many.call_args_list]
+    # Full batch, then the remainder flushed before the tool entry, then the tail
+    assert [len(batch) for batch in batches] == [
+        agent_runner.TEXT_LOG_BATCH_SIZE,
+        40 - agent_runner.TEXT_LOG_BATCH_SIZE,
+        1,
+    ]
+    assert batches[-1] == ["tail"]
+    call_names = [name for name, *_ in task_logger.method_calls]
+    assert call_names.index("tool_start") == call_names.index("log_many") + 2
+
+
+def test_streamed_text_flushed_once_per_interval(run_stream, monkeypatch):
+    flushes = []
+    monkeypatch.setattr(agent_runner.sys.stdout, "flush", lambda: flushes.append(1))
+    messages = [AssistantMessage([TextBlock(f"token{i}") for i in range(100)])]
+
+    success, response = run_stream(messages)
+
+    assert success is True
+    assert response == "".join(f"token{i}" for i in range(100))
+    # One flush when the stream ends instead of one per token
+    assert len(flushes) < 5
+
+
+def test_idle_stream_aborts_phase(run_stream, monkeypatch):
+    monkeypatch.setattr(agent_runner, "STREAM_IDLE_TIMEOUT_SEC", 0.05)
+    task_logger = MagicMock()
+
+    success, message = run_stream(
+        [AssistantMessage([TextBlock("late")])], task_logger, delay=0.5
+    )
+
+    assert success is False
+    assert message == "No agent output for 0s; aborting phase"
+    task_logger.log_error.assert_called_once()
+
+
+def test_idle_timeout_without_task_uncancel(run_stream, monkeypatch):
+    """Python 3.10 tasks have no uncancel(); the timeout is still reported."""
+    monkeypatch.setattr(agent_runner, "STREAM_IDLE_TIMEOUT_SEC", 0.05)
+    real_current_task = asyncio.current_task
+
+    class _Py310Task:
+        def __init__(self, task):
+            self._task = task
+
+        def cancel(self, *args):
+            return self._task.cancel(*args)
+
+    monkeypatch.setattr(
+        agent_runner.asyncio,
+        "current_task",
+        lambda *args: _Py310Task(real_current_task(*args)),
+    )
+
+    success, message = run_stream([AssistantMessage([TextBlock("late")])], delay=0.5)
+
+    assert success is False
+    assert message == "No agent output for 0s; aborting phase"
+
+
+def test_steady_stream_outlives_idle_timeout(run_stream, monkeypatch):
+    monkeypatch.setattr(agent_runner, "STREAM_IDLE_TIMEOUT_SEC", 0.2)
+    # Total runtime exceeds the timeout but no single gap does
+    messages = [AssistantMessage([TextBlock("x")]) for _ in range(8)]
+
+    success, response = run_stream(messages, delay=0.05)
+
+    assert success is True
+    assert response == "x" * 8
+
+
+def test_build_prompt_appends_context(tmp_path):
+    prompt_file = tmp_path / "p.md"
+    prompt_file.write_text("Base")
+    runner = AgentRunner(tmp_path / "proj", tmp_path / "spec", "test-model")
+
+    prompt = runner._build_prompt(prompt_file, "Summaries", "Extra")
+
+    assert prompt == (
+        f"Base\n\n---\n\n**Spec Directory**: {tmp_path / 'spec'}\n"
+        f"**Project Directory**: {tmp_path / 'proj'}\n"
+        "\nSummaries\n\nExtra\n"
+    )
+
+
+def test_missing_prompt_fails_phase(tmp_path):
+    runner = AgentRunner(tmp_path, tmp_path, "test-model")
+
+    success, message = asyncio.run(runner.run_agent(str(tmp_path / "missing.md")))
+
+    assert success is False
+    assert message.startswith("Prompt not found")
+
+
+@pytest.mark.parametrize(
+    "inp, expected",
+    [
+        ({"pattern": "TODO", "file_path": "a.py"}, "pattern: TODO"),
+        ({"file_path": "d/" * 30}, "..." + ("d/" * 30)[-47:]),
+        ({"command": "x" * 60}, "x" * 47 + "..."),
+        ({"path": "src"}, "src"),
+        ({"other": 1}, None),
+        ("not a dict", None),
+    ],
+)
+def test_tool_input_display(inp, expected):
+    assert agent_runner._extract_tool_input_display(inp) == expected
+
+
+def test_tool_detail_content_size_limit():
+    limit = agent_runner.TOOL_DETAIL_MAX_CHARS
+    detail = agent_runner._get_tool_detail_content
+
+    assert detail("Read", "a" * (limit - 1)) == "a" * (limit - 1)
+    assert detail("Read", "a" * limit) is None
+    assert detail("Bash", [{"type": "text"}] * limit) is None
+    assert detail("Grep", ["hit"]) == "['hit']"
+    assert detail("Glob", "anything") is None
+
+
+@pytest.mark.parametrize("level, expected", [("1", 0), ("2", 3)])
+def test_per_message_debug_gated_on_level(run_stream, monkeypatch, level, expected):
+    monkeypatch.setenv("DEBUG", "true")
+    monkeypatch.setenv("DEBUG_LEVEL", level)
+    received = []
+    monkeypatch.setattr(
+        agent_runner,
+        "debug_detailed",
+        lambda module, message, **kw: received.append(message),
+    )
+    messages = [AssistantMessage([TextBlock("x")]) for _ in range(3)]
+
+    run_stream(messages)
+
+    assert sum(m.startswith("Received message") for m in received) == expected
+
+
+def test_agent_cache_is_opt_in(run_stream, monkeypatch, tmp_path):
+    first = [AssistantMessage([TextBlock("first")])]
+    second = [AssistantMessage([TextBlock("second")])]
+
+    assert run_stream(first) == (True, "first")
+    assert run_stream(second) == (True, "second")
+    assert not (tmp_path / agent_runner.AGENT_CACHE_DIR).exists()
+
+    monkeypatch.setenv("IFLOW_AGENT_CACHE", "1")
+    assert run_stream(first) == (True, "first")
+    # Same prompt, model and budget: replayed without running the agent
+    assert run_stream(second) == (True, "first")
+    assert len(list((tmp_path / agent_runner.AGENT_CACHE_DIR).iterdir())) == 1
+
+
+def test_tool_call_attrs_narrowed_for_declared_fields(run_stream):
+    @dataclass
+    class ToolCallMessage:
+        tool_name: str
+        args: dict
+        output: str | None = None
+
+    attrs = agent_runner._tool_call_attrs(ToolCallMessage)
+    assert attrs["name"] == ("tool_name",)
+    assert attrs["id"] == ()
+    task_logger = MagicMock()
+
+    run_stream(
+        [ToolCallMessage("Bash", {"command": "ls"}, output="out")], task_logger
+    )
+
+    task_logger.tool_start.assert_called_once()
+    assert task_logger.tool_end.call_args.kwargs["detail"] == "out"
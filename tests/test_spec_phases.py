@@ -372,6 +372,38 @@ class TestPhaseRequirements:
             req = json.load(f)
         assert req["task_description"] == "Add user authentication"
 
+    @pytest.mark.asyncio
+    async def test_requirements_interactive_prewarms_project_index(
+        self,
+        spec_dir: Path,
+        temp_dir: Path,
+        mock_run_agent_fn,
+        mock_task_logger,
+        mock_ui_module,
+        mock_spec_validator,
+    ):
+        """Interactive gathering loads project_index.json while the user types."""
+        (spec_dir / "project_index.json").write_text(json.dumps({"services": {}}))
+        executor = PhaseExecutor(
+            project_dir=temp_dir,
+            spec_dir=spec_dir,
+            task_description="",
+            spec_validator=mock_spec_validator(),
+            run_agent_fn=mock_run_agent_fn(),
+            task_logger=mock_task_logger,
+            ui_module=mock_ui_module,
+        )
+
+        with patch(
+            "spec.requirements.gather_requirements_interactively",
+            return_value={"task_description": "Add export", "workflow_type": "feature"},
+        ):
+            result = await executor.phase_requirements(interactive=True)
+
+        assert result.success is True
+        assert executor.task_description == "Add export"
+        assert "project_index.json" in executor._spec_json_cache
+
 
 class TestPhaseContext:
     """Tests for phase_context method."""
@@ -871,6 +903,162 @@ class TestRunScript:
         assert "not found" in output.lower()
 
 
+class TestTaskPathExtraction:
+    """Tests for _extract_task_paths helper method."""
+
+    def test_extracts_project_relative_paths(
+        self,
+        temp_dir: Path,
+        spec_dir: Path,
+        mock_run_agent_fn,
+        mock_task_logger,
+        mock_ui_module,
+        mock_spec_validator,
+    ):
+        """Paths inside the project are returned relative, punctuation trimmed."""
+        executor = PhaseExecutor(
+            project_dir=temp_dir,
+            spec_dir=spec_dir,
+            task_description="Test task",
+            spec_validator=mock_spec_validator(),
+            run_agent_fn=mock_run_agent_fn(),
+            task_logger=mock_task_logger,
+            ui_module=mock_ui_module,
+        )
+        project_root = temp_dir.resolve()
+        description = (
+            f"Update {project_root}/docs/guide.md, then check "
+            f"({project_root}/src/main.py) and /outside/file.txt"
+        )
+
+        paths = executor._extract_task_paths(description)
+
+        assert paths == [str(Path("docs/guide.md")), str(Path("src/main.py"))]
+
+
+class TestSpecJsonCache:
+    """Tests for reusing parsed spec JSON files across phases."""
+
+    def test_requirements_reparsed_only_when_file_changes(
+        self,
+        temp_dir: Path,
+        spec_dir: Path,
+        mock_run_agent_fn,
+        mock_task_logger,
+        mock_ui_module,
+        mock_spec_validator,
+    ):
+        executor = PhaseExecutor(
+            project_dir=temp_dir,
+            spec_dir=spec_dir,
+            task_description="Test task",
+            spec_validator=mock_spec_validator(),
+            run_agent_fn=mock_run_agent_fn(),
+            task_logger=mock_task_logger,
+            ui_module=mock_ui_module,
+        )
+        requirements_file = spec_dir / "requirements.json"
+        requirements_file.write_text(json.dumps({"task_description": "first"}))
+
+        first = executor._load_requirements()
+        assert executor._load_requirements() is first
+
+        requirements_file.write_text(json.dumps({"task_description": "second one"}))
+        assert executor._load_requirements() == {"task_description": "second one"}
+
+        requirements_file.unlink()
+        assert executor._load_requirements() is None
+
+
+class TestScopeContractValidationCache:
+    """Tests for reusing scope contract validation between phases."""
+
+    def test_revalidates_only_when_contract_changes(
+        self,
+        temp_dir: Path,
+        spec_dir: Path,
+        mock_run_agent_fn,
+        mock_task_logger,
+        mock_ui_module,
+        mock_spec_validator,
+    ):
+        spec_validator = mock_spec_validator()
+        executor = PhaseExecutor(
+            project_dir=temp_dir,
+            spec_dir=spec_dir,
+            task_description="Test task",
+            spec_validator=spec_validator,
+            run_agent_fn=mock_run_agent_fn(),
+            task_logger=mock_task_logger,
+            ui_module=mock_ui_module,
+        )
+        scope_file = spec_dir / "scope_contract.json"
+        scope_file.write_text(json.dumps({"intent": "change"}))
+
+        first = executor._validate_scope_contract()
+        assert executor._validate_scope_contract() is first
+        assert spec_validator.validate_scope_contract.call_count == 1
+
+        scope_file.write_text(json.dumps({"intent": "create"}))
+        executor._validate_scope_contract()
+        assert spec_validator.validate_scope_contract.call_count == 2
+
+
+class TestTaskInference:
+    """Tests for keyword-based intent and task type inference."""
+
+    @pytest.fixture
+    def executor(
+        self,
+        temp_dir: Path,
+        spec_dir: Path,
+        mock_run_agent_fn,
+        mock_task_logger,
+        mock_ui_module,
+        mock_spec_validator,
+    ):
+        return PhaseExecutor(
+            project_dir=temp_dir,
+            spec_dir=spec_dir,
+            task_description="Test task",
+            spec_validator=mock_spec_validator(),
+            run_agent_fn=mock_run_agent_fn(),
+            task_logger=mock_task_logger,
+            ui_module=mock_ui_module,
+        )
+
+    def test_task_type_uses_category_priority(self, executor):
+        """Earlier categories win regardless of where keywords appear."""
+        assert executor._infer_task_type("Write up an analysis", None) == "analysis"
+        assert executor._infer_task_type("Update the README roadmap", None) == "plan"
+        assert executor._infer_task_type("Fix the login bug", None) == "code"
+
+    def test_task_type_prefers_workflow(self, executor):
+        assert executor._infer_task_type("Write docs", "audit") == "audit"
+
+    def test_intent_keywords(self, executor):
+        assert executor._infer_intent("Remove and rebuild the cache", None) == "create"
+        assert executor._infer_intent("Drop the legacy table", None) == "delete"
+        assert executor._infer_intent("Tweak the header", None) == "change"
+
+    def test_acceptance_bullets_after_header(self, executor):
+        description = (
+            "Add export\n"
+            "Acceptance Criteria:\n"
+            "\n"
+            "- CSV download works\n"
+            "* Large files stream\n"
+            "\n"
+            "- Not part of the list\n"
+        )
+        assert executor._infer_acceptance(description) == [
+            "CSV download works",
+            "Large files stream",
+        ]
+        assert executor._infer_acceptance("Success criteria - inline only") == []
+        assert executor._infer_acceptance("- no header here") == []
+
+
 class TestMaxRetriesConstant:
     """Tests for MAX_RETRIES configuration."""
 
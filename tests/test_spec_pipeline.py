@@ -11,6 +11,7 @@ Tests the spec/pipeline.py module functionality including:
 """
 
 import json
+import os
 import pytest
 import sys
 import time
@@ -593,3 +594,388 @@ class TestSpecOrchestratorAssessment:
             orchestrator = SpecOrchestrator(project_dir=temp_dir)
 
             assert orchestrator.assessment is None
+
+
+class TestGroupConcurrentPhases:
+    """Tests for batching independent phases."""
+
+    def test_adjacent_independent_phases_share_a_batch(self):
+        """historical_context and research run together; others stay alone."""
+        from spec.pipeline.models import group_concurrent_phases
+
+        batches = group_concurrent_phases(
+            ["historical_context", "research", "context", "spec_writing"]
+        )
+
+        assert batches == [
+            ["historical_context", "research"],
+            ["context"],
+            ["spec_writing"],
+        ]
+
+    def test_non_adjacent_phases_keep_order(self):
+        """Independent phases separated by another phase are not merged."""
+        from spec.pipeline.models import group_concurrent_phases
+
+        batches = group_concurrent_phases(
+            ["historical_context", "quick_spec", "research"]
+        )
+
+        assert batches == [["historical_context"], ["quick_spec"], ["research"]]
+
+
+class TestPhaseSummaryScheduling:
+    """Tests for background phase summaries."""
+
+    def _orchestrator(self, temp_dir: Path) -> SpecOrchestrator:
+        with patch('spec.pipeline.models.init_auto_build_dir') as mock_init:
+            mock_init.return_value = (temp_dir / ".auto-iflow", False)
+            (temp_dir / ".auto-iflow" / "specs").mkdir(parents=True, exist_ok=True)
+            return SpecOrchestrator(project_dir=temp_dir)
+
+    def test_summaries_stored_in_phase_order(self, temp_dir: Path):
+        """A slow earlier summary still lands before a faster later one."""
+        import asyncio
+
+        orchestrator = self._orchestrator(temp_dir)
+        delays = {"discovery": 0.05, "requirements": 0.0}
+
+        async def fake_summarize(phase_name, phase_output, **kwargs):
+            await asyncio.sleep(delays[phase_name])
+            return f"{phase_name} summary"
+
+        async def scenario():
+            orchestrator._schedule_phase_summary("discovery")
+            orchestrator._schedule_phase_summary("requirements")
+            await orchestrator._collect_phase_summaries()
+
+        with patch(
+            'spec.pipeline.orchestrator.gather_phase_outputs',
+            side_effect=lambda spec_dir, name: f"{name} output",
+        ), patch(
+            'spec.pipeline.orchestrator.summarize_phase_output', fake_summarize
+        ):
+            asyncio.run(scenario())
+
+        assert list(orchestrator._phase_summaries.items()) == [
+            ("discovery", "discovery summary"),
+            ("requirements", "requirements summary"),
+        ]
+        assert orchestrator._pending_summaries == []
+
+    def test_formatted_summaries_reused_until_changed(self, temp_dir: Path):
+        """Agent calls reformat summaries only after a new one is stored."""
+        import asyncio
+
+        orchestrator = self._orchestrator(temp_dir)
+        runner = MagicMock()
+        runner.run_agent = AsyncMock(return_value=(True, "ok"))
+        orchestrator._agent_runner = runner
+
+        async def fake_summarize(phase_name, phase_output, **kwargs):
+            return f"{phase_name} summary"
+
+        async def scenario():
+            orchestrator._schedule_phase_summary("discovery")
+            await orchestrator._run_agent("a.md")
+            await orchestrator._run_agent("b.md")
+            orchestrator._schedule_phase_summary("requirements")
+            await orchestrator._run_agent("c.md")
+
+        with patch(
+            'spec.pipeline.orchestrator.gather_phase_outputs',
+            side_effect=lambda spec_dir, name: f"{name} output",
+        ), patch(
+            'spec.pipeline.orchestrator.summarize_phase_output', fake_summarize
+        ), patch(
+            'spec.pipeline.orchestrator.format_phase_summaries',
+            side_effect=lambda summaries: ", ".join(summaries.values()),
+        ) as fmt:
+            asyncio.run(scenario())
+
+        assert fmt.call_count == 2
+        passed = [
+            call.kwargs["prior_phase_summaries"]
+            for call in runner.run_agent.call_args_list
+        ]
+        assert passed == [
+            "discovery summary",
+            "discovery summary",
+            "discovery summary, requirements summary",
+        ]
+
+    def test_concurrent_summaries_capped(self, temp_dir: Path):
+        """At most MAX_CONCURRENT_SUMMARIES summarization calls run at once."""
+        import asyncio
+
+        from spec.pipeline import orchestrator as orchestrator_module
+
+        orchestrator = self._orchestrator(temp_dir)
+        running = []
+        peak = []
+
+        async def fake_summarize(phase_name, phase_output, **kwargs):
+            running.append(phase_name)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(phase_name)
+            return f"{phase_name} summary"
+
+        phase_names = [f"phase{i}" for i in range(6)]
+
+        async def scenario():
+            for name in phase_names:
+                orchestrator._schedule_phase_summary(name)
+            await orchestrator._collect_phase_summaries()
+
+        with patch(
+            'spec.pipeline.orchestrator.gather_phase_outputs',
+            side_effect=lambda spec_dir, name: f"{name} output",
+        ), patch(
+            'spec.pipeline.orchestrator.summarize_phase_output', fake_summarize
+        ):
+            asyncio.run(scenario())
+
+        assert max(peak) == orchestrator_module.MAX_CONCURRENT_SUMMARIES
+        assert list(orchestrator._phase_summaries) == phase_names
+
+    def test_phase_without_outputs_schedules_nothing(self, temp_dir: Path):
+        """Phases with nothing to summarize do not start a task."""
+        orchestrator = self._orchestrator(temp_dir)
+
+        with patch(
+            'spec.pipeline.orchestrator.gather_phase_outputs', return_value=""
+        ):
+            orchestrator._schedule_phase_summary("senior_review")
+
+        assert orchestrator._pending_summaries == []
+
+    def test_unconsumed_summaries_cancelled(self, temp_dir: Path):
+        """Summaries nobody waits for are cancelled when the run ends."""
+        import asyncio
+
+        orchestrator = self._orchestrator(temp_dir)
+
+        async def never_finishes(phase_name, phase_output, **kwargs):
+            await asyncio.sleep(3600)
+
+        async def scenario():
+            orchestrator._schedule_phase_summary("planning")
+            task = orchestrator._pending_summaries[0][1]
+            orchestrator._cancel_phase_summaries()
+            await asyncio.sleep(0)
+            return task
+
+        with patch(
+            'spec.pipeline.orchestrator.gather_phase_outputs', return_value="plan"
+        ), patch(
+            'spec.pipeline.orchestrator.summarize_phase_output', never_finishes
+        ):
+            task = asyncio.run(scenario())
+
+        assert task.cancelled()
+        assert orchestrator._pending_summaries == []
+
+
+class TestTaskIntakeCache:
+    """Tests for reusing the parsed task_intake.json."""
+
+    def test_intake_parsed_once_per_file_version(self, temp_dir: Path):
+        """Unchanged intake is not re-read; a rewrite is picked up."""
+        import os
+
+        from spec.pipeline import orchestrator as orchestrator_module
+
+        with patch('spec.pipeline.models.init_auto_build_dir') as mock_init:
+            mock_init.return_value = (temp_dir / ".auto-iflow", False)
+            (temp_dir / ".auto-iflow" / "specs").mkdir(parents=True, exist_ok=True)
+            orchestrator = SpecOrchestrator(project_dir=temp_dir)
+
+        assert orchestrator._get_task_intake() == ({}, "")
+
+        intake_file = orchestrator.spec_dir / "task_intake.json"
+        intake_file.write_text(json.dumps({"task_type": "docs"}))
+        with patch(
+            'spec.pipeline.orchestrator.load_task_intake',
+            wraps=orchestrator_module.load_task_intake,
+        ) as loader:
+            intake, context = orchestrator._get_task_intake()
+            orchestrator._get_task_intake()
+            assert loader.call_count == 1
+
+            intake_file.write_text(json.dumps({"task_type": "code", "x": 1}))
+            stat = intake_file.stat()
+            os.utime(intake_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert orchestrator._load_task_intake() == {"task_type": "code", "x": 1}
+            assert loader.call_count == 2
+
+        assert intake == {"task_type": "docs"}
+        assert "- task_type: docs" in context
+
+
+class TestGatherPhaseOutputs:
+    """Tests for collecting phase output files for summarization."""
+
+    def test_reads_existing_outputs_and_truncates(self, temp_dir: Path):
+        """Missing files are skipped and long files are capped."""
+        from spec.compaction import MAX_OUTPUT_FILE_CHARS, gather_phase_outputs
+
+        (temp_dir / "spec.md").write_text("x" * (MAX_OUTPUT_FILE_CHARS + 50))
+
+        output = gather_phase_outputs(temp_dir, "self_critique")
+
+        assert output.startswith("**spec.md**:\n```\n")
+        assert "critique_notes.md" not in output
+        assert output.count("x") == MAX_OUTPUT_FILE_CHARS
+        assert "[... file truncated ...]" in output
+
+    def test_phase_without_outputs(self, temp_dir: Path):
+        """Phases with no mapped outputs gather nothing."""
+        from spec.compaction import gather_phase_outputs
+
+        assert gather_phase_outputs(temp_dir, "senior_review") == ""
+
+
+class TestAssessmentInputs:
+    """Tests for the JSON inputs read during complexity assessment."""
+
+    def _orchestrator(self, temp_dir: Path) -> SpecOrchestrator:
+        with patch('spec.pipeline.models.init_auto_build_dir') as mock_init:
+            mock_init.return_value = (temp_dir / ".auto-iflow", False)
+            (temp_dir / ".auto-iflow" / "specs").mkdir(parents=True, exist_ok=True)
+            return SpecOrchestrator(project_dir=temp_dir)
+
+    def test_requirements_context_missing_file(self, temp_dir: Path):
+        """No requirements.json yields an empty context."""
+        import asyncio
+
+        orchestrator = self._orchestrator(temp_dir)
+
+        context = asyncio.run(
+            orchestrator._load_requirements_context(temp_dir / "missing.json")
+        )
+
+        assert context == ""
+
+    def test_requirements_context_updates_task_description(self, temp_dir: Path):
+        """The task description is taken from requirements.json."""
+        import asyncio
+
+        orchestrator = self._orchestrator(temp_dir)
+        requirements_file = temp_dir / "requirements.json"
+        requirements_file.write_text(
+            json.dumps(
+                {"task_description": "Add login", "acceptance_criteria": ["Works"]}
+            )
+        )
+
+        context = asyncio.run(orchestrator._load_requirements_context(requirements_file))
+
+        assert orchestrator.task_description == "Add login"
+        assert "**Task Description**: Add login" in context
+        assert "- Works" in context
+
+
+class TestTaskLoggerReuse:
+    """Tests for resolving the task logger once per orchestrator."""
+
+    def test_task_logger_resolved_once(self, temp_dir: Path):
+        """Later lookups reuse the first logger even if spec_dir changes."""
+        with patch('spec.pipeline.models.init_auto_build_dir') as mock_init:
+            mock_init.return_value = (temp_dir / ".auto-iflow", False)
+            (temp_dir / ".auto-iflow" / "specs").mkdir(parents=True, exist_ok=True)
+            orchestrator = SpecOrchestrator(project_dir=temp_dir)
+
+        with patch('spec.pipeline.orchestrator.get_task_logger') as get_logger:
+            first = orchestrator._get_task_logger()
+            orchestrator.spec_dir = temp_dir / "renamed"
+            assert orchestrator._get_task_logger() is first
+            assert orchestrator._get_agent_runner().task_logger is first
+
+        get_logger.assert_called_once()
+
+
+class TestLinearTaskBackground:
+    """Tests for creating the Linear task alongside later phases."""
+
+    def test_linear_task_started_once_and_joined(self, temp_dir: Path):
+        """The task runs in the background, is started once, and failures are tolerated."""
+        import asyncio
+
+        with patch('spec.pipeline.models.init_auto_build_dir') as mock_init:
+            mock_init.return_value = (temp_dir / ".auto-iflow", False)
+            (temp_dir / ".auto-iflow" / "specs").mkdir(parents=True, exist_ok=True)
+            orchestrator = SpecOrchestrator(project_dir=temp_dir)
+
+        calls = []
+
+        async def create_linear_task():
+            calls.append("start")
+            await asyncio.sleep(0)
+            raise RuntimeError("linear down")
+
+        orchestrator._create_linear_task_if_enabled = create_linear_task
+
+        async def scenario():
+            orchestrator._start_linear_task()
+            orchestrator._start_linear_task()
+            assert calls == []  # Not awaited on the critical path
+            await orchestrator._join_linear_task()
+            await orchestrator._join_linear_task()
+
+        with patch('spec.pipeline.orchestrator.print_status') as status:
+            asyncio.run(scenario())
+
+        assert calls == ["start"]
+        assert orchestrator._linear_task is None
+        status.assert_called_once_with("Linear task creation failed: linear down", "warning")
+
+
+class TestScopedEnv:
+    """Tests for the security-hook env vars set during a run."""
+
+    def test_env_restored_after_block(self, monkeypatch):
+        """Values set inside the block are reverted, unset vars are removed."""
+        from spec.pipeline import orchestrator as orchestrator_module
+
+        monkeypatch.setenv("AUTO_IFLOW_TEST_KEEP", "before")
+        monkeypatch.delenv("AUTO_IFLOW_TEST_NEW", raising=False)
+
+        with orchestrator_module._restore_env(
+            ["AUTO_IFLOW_TEST_KEEP", "AUTO_IFLOW_TEST_NEW"]
+        ):
+            orchestrator_module._apply_env(
+                {"AUTO_IFLOW_TEST_KEEP": "during", "AUTO_IFLOW_TEST_NEW": "x"}
+            )
+            assert os.environ["AUTO_IFLOW_TEST_KEEP"] == "during"
+            assert os.environ["AUTO_IFLOW_TEST_NEW"] == "x"
+
+        assert os.environ["AUTO_IFLOW_TEST_KEEP"] == "before"
+        assert "AUTO_IFLOW_TEST_NEW" not in os.environ
+
+
+class TestProjectIndexRefresh:
+    """Tests for regenerating project_index.json before spec creation."""
+
+    def test_index_regenerated_off_event_loop(self, temp_dir: Path):
+        """analyze_project runs in a worker thread, not on the loop's thread."""
+        import asyncio
+        import threading
+
+        with patch('spec.pipeline.models.init_auto_build_dir') as mock_init:
+            mock_init.return_value = (temp_dir / ".auto-iflow", False)
+            (temp_dir / ".auto-iflow" / "specs").mkdir(parents=True, exist_ok=True)
+            orchestrator = SpecOrchestrator(project_dir=temp_dir)
+
+        threads = []
+
+        def fake_analyze(project_dir, index_file):
+            threads.append(threading.current_thread())
+
+        with patch(
+            'spec.pipeline.orchestrator.should_refresh_project_index', return_value=True
+        ), patch('spec.pipeline.orchestrator.analyze_project', fake_analyze):
+            asyncio.run(orchestrator._ensure_fresh_project_index())
+
+        assert len(threads) == 1
+        assert threads[0] is not threading.main_thread()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for Task Logger
+=====================
+
+Tests the task_logger package covering:
+- Batched logging via log_many
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def task_logger_module():
+    """Import task_logger at test time, after conftest has removed mocks of it."""
+    import task_logger
+
+    return task_logger
+
+
+def test_log_many_writes_entries_with_one_save(tmp_path: Path, task_logger_module):
+    TaskLogger = task_logger_module.TaskLogger
+    LogEntryType = task_logger_module.LogEntryType
+    LogPhase = task_logger_module.LogPhase
+    logger = TaskLogger(tmp_path, emit_markers=False)
+
+    with patch.object(logger.storage, "save", wraps=logger.storage.save) as save:
+        logger.log_many(
+            ["first", "second"],
+            LogEntryType.TEXT,
+            LogPhase.PLANNING,
+            print_to_console=False,
+        )
+
+    assert save.call_count == 1
+    data = json.loads((tmp_path / TaskLogger.LOG_FILE).read_text())
+    entries = data["phases"][LogPhase.PLANNING.value]["entries"]
+    assert [entry["content"] for entry in entries] == ["first", "second"]
+    assert {entry["type"] for entry in entries} == {LogEntryType.TEXT.value}
+
+
+def test_log_many_ignores_empty_batch(tmp_path: Path, task_logger_module):
+    logger = task_logger_module.TaskLogger(tmp_path, emit_markers=False)
+
+    with patch.object(logger.storage, "save") as save:
+        logger.log_many([])
+
+    save.assert_not_called()